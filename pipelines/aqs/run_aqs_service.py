@@ -33,8 +33,9 @@ If neither is provided, the runner executes sample, annual, and daily services i
 
 from __future__ import annotations
 
+import glob
+import json
 import os
-import re
 import sys
 import threading
 from concurrent.futures import ThreadPoolExecutor
@@ -52,12 +53,13 @@ import config
 from aqs import _client
 from aqs.extractors.aqs_service import fetch_samples_dispatch
 from aqs.extractors.measurements import (
+    AUDIT,
     write_annual_for_parameter,
     write_daily_for_parameter,
 )
 from aqs.transformers.trv_annual import transform_toxics_annual_trv
 from aqs.transformers.trv_sample import transform_toxics_trv
-from loaders.filesystem import append_csv, atomic_write_json, write_csv
+from loaders.filesystem import CsvAppender, append_csv, atomic_write_json, write_csv
 from logging_config import (
     get_logger,
     log_error_with_context,
@@ -65,6 +67,7 @@ from logging_config import (
     log_pipeline_start,
     setup_logging,
 )
+from utils import sanitize_filename
 
 SAMPLE_BASE_DIR = config.RAW_AQS_SAMPLE
 
@@ -114,8 +117,6 @@ def _load_checkpoint(service: str, year: str | None = None) -> dict:
     with lock:
         if checkpoint_path.exists():
             try:
-                import json
-
                 with open(checkpoint_path, encoding="utf-8") as fh:
                     return json.load(fh)
             except Exception:
@@ -143,7 +144,7 @@ def _clear_checkpoint(service: str, year: str | None = None) -> None:
 
 def _write_parameter_outputs(param_label: str, frame: pd.DataFrame) -> None:
     SAMPLE_BASE_DIR.mkdir(parents=True, exist_ok=True)
-    safe_label = _sanitize_filename(param_label)
+    safe_label = sanitize_filename(param_label)
     csv_path = SAMPLE_BASE_DIR / f"aqs_sample_{safe_label}.csv"
     write_csv(frame, csv_path)
 
@@ -176,16 +177,18 @@ def _process_parameter_for_year(
             total = 0
 
             if hasattr(res, "__iter__") and not isinstance(res, pd.DataFrame):
-                # Streaming mode: process yearly data chunks
+                # Streaming mode: process yearly data chunks, keeping each
+                # year file open across its monthly chunks
                 SAMPLE_BASE_DIR.mkdir(parents=True, exist_ok=True)
-                for year_token, df in res:
-                    if df is None or df.empty:
-                        continue
-                    year_csv = (
-                        SAMPLE_BASE_DIR / f"aqs_sample_{group_store}_{year_token}.csv"
-                    )
-                    append_csv(df, year_csv)
-                    total += len(df)
+                with CsvAppender() as appender:
+                    for year_token, df in res:
+                        if df is None or df.empty:
+                            continue
+                        year_csv = (
+                            SAMPLE_BASE_DIR / f"aqs_sample_{group_store}_{year_token}.csv"
+                        )
+                        appender.append(df, year_csv)
+                        total += len(df)
             else:
                 # Legacy batch mode
                 df_all = res
@@ -256,50 +259,11 @@ def _log_skipped_parameters(skipped_params: list[dict]) -> None:
     df = pd.DataFrame(skipped_params)
     
     # Append to existing file or create new with header
-    from loaders.filesystem import append_csv
     append_csv(df, log_file)
     
     print(f"   📝 Logged {len(skipped_params)} skipped parameter(s) to {log_file.name}")
 
 
-def _sanitize_filename(name: str, max_len: int = 80) -> str:
-    """Convert parameter name to filesystem-safe filename component.
-
-    Transforms human-readable names like "PM2.5 - Local Conditions" into
-    safe filenames like "PM2-5-Local-Conditions".
-
-    Rules:
-        - Whitespace → single dash
-        - Remove unsafe characters (keep only alphanumeric, dash, underscore, dot)
-        - Collapse repeated separators
-        - Strip leading/trailing separators
-        - Limit length to max_len characters
-
-    Args:
-        name: Parameter name to sanitize
-        max_len: Maximum allowed filename length (default 80)
-
-    Returns:
-        Filesystem-safe string suitable for use in filenames
-    """
-    if not name:
-        return "unknown"
-
-    # Normalize whitespace to single dash
-    s = re.sub(r"\s+", "-", name)
-    # Remove unsafe characters (keep only alphanumeric, dot, dash, underscore)
-    s = re.sub(r"[^A-Za-z0-9._-]", "", s)
-    # Collapse multiple consecutive dashes/underscores
-    s = re.sub(r"[-_]{2,}", "-", s)
-    # Strip leading/trailing non-alphanumeric characters
-    s = re.sub(r"(^[^A-Za-z0-9]+)|([^A-Za-z0-9]+$)", "", s)
-    if not s:
-        return "unknown"
-    if len(s) > max_len:
-        s = s[:max_len].rstrip("-_.")
-    return s
-
-
 def _process_year_sample(
     year: str, all_params: list[tuple[str, str, str]], state: str
 ) -> int:
@@ -493,8 +457,6 @@ def run_transform_service() -> None:
 
     # Transform sample toxics data to TRV exceedances
     print("\n🔄 Transforming SAMPLE toxics data to TRV exceedances...")
-    import glob
-
     toxics_files = glob.glob(str(SAMPLE_BASE_DIR / "aqs_sample_toxics_*.csv"))
     dim_pollutant_path = ROOT / "ops" / "dimPollutant.csv"
     transform_dir = config.ROOT / "transform" / "trv" / "sample"
@@ -598,8 +560,6 @@ def run(
 
     # Check circuit breaker
     if _client.circuit_is_open():
-        from loaders.filesystem import atomic_write_json
-
         manifest_dir = ROOT / "metadata"
         manifest_dir.mkdir(parents=True, exist_ok=True)
         degraded = {
@@ -713,6 +673,9 @@ def run(
         logger.error(f"❌ Pipeline execution failed: {e}")
         log_pipeline_end("AQS Full Pipeline", success=False, error=str(e))
         raise
+    finally:
+        # Write the run's extraction audit records in one file
+        AUDIT.flush()
 
 
 if __name__ == "__main__":
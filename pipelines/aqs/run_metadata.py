@@ -16,7 +16,6 @@ ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT / "src"))
 
 import json
-import re
 from pathlib import Path
 
 import pandas as pd
@@ -25,6 +24,7 @@ import config
 from aqs import _client
 from aqs.extractors.monitors import fetch_monitors
 from loaders.filesystem import write_csv
+from utils import sanitize_filename
 
 RAW_PARQUET = config.RAW_AQS_MONITORS / "monitors_raw.parquet"
 RAW_CSV = config.RAW_AQS_MONITORS / "monitors_raw.csv"
@@ -73,7 +73,7 @@ def run() -> None:
     try:
         fields = _client.fetch_json(
             session,
-            f"https://aqs.epa.gov/data/api/metaData/fieldsByService?email={config.AQS_EMAIL}&key={config.AQS_KEY}&service=sampleData",
+            f"https://aqs.epa.gov/data/api/metaData/fieldsByService?{_client.credentials_query()}&service=sampleData",
         )
         (metadata_dir / "fields_sampleData.json").write_text(json.dumps(fields))
     except Exception:
@@ -145,7 +145,7 @@ def run() -> None:
         if df.empty:
             print(f"No monitors found for {code} ({label})")
             continue
-        safe_label = _sanitize_filename(label)
+        safe_label = sanitize_filename(label)
         csv_path = config.RAW_AQS_MONITORS / f"monitors_{safe_label}.csv"
         write_csv(df, csv_path)
         total_rows += len(df)
@@ -156,24 +156,5 @@ def run() -> None:
     )
 
 
-def _sanitize_filename(name: str, max_len: int = 80) -> str:
-    """Return a filesystem-safe token based on `name`.
-
-    Matches the sanitizer in sample_run.py: normalize whitespace to dashes,
-    remove unsafe chars, collapse separators, strip edges, and truncate.
-    """
-    if not name:
-        return "unknown"
-    s = re.sub(r"\s+", "-", name)
-    s = re.sub(r"[^A-Za-z0-9._-]", "", s)
-    s = re.sub(r"[-_]{2,}", "-", s)
-    s = re.sub(r"(^[^A-Za-z0-9]+)|([^A-Za-z0-9]+$)", "", s)
-    if not s:
-        return "unknown"
-    if len(s) > max_len:
-        s = s[:max_len].rstrip("-_.")
-    return s
-
-
 if __name__ == "__main__":
     run()
@@ -18,7 +18,7 @@ ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT / "src"))
 
 import config
-from aqs.extractors.measurements import write_qualifiers_for_toxics
+from aqs.extractors.measurements import AUDIT, write_qualifiers_for_toxics
 
 
 def run_qualifiers_toxics():
@@ -35,6 +35,7 @@ def run_qualifiers_toxics():
 
     # Extract qualifiers for all toxics parameters
     results = write_qualifiers_for_toxics(bdate, edate, state_fips)
+    AUDIT.flush()
 
     # Report results
     print("\n📊 Extraction Results:")
@@ -9,7 +9,9 @@ Output: All staged fact and dimension tables in soar/staged/
 
 from __future__ import annotations
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 # Add src directory to Python path
@@ -29,6 +31,15 @@ from stage.consolidate_fct_ozone_hourly import run_consolidation as run_ozone_ho
 from stage.consolidate_fct_ozone_dv import run_consolidation as run_ozone_dv
 from stage.consolidate_fct_pm25_dv import run_consolidation as run_pm25_dv
 
+# Stagings with no dependency on each other's outputs: (result key, label, runner)
+INDEPENDENT_STAGES = [
+    ("toxics_annual", "toxics annual", run_toxics_annual),
+    ("toxics_sample", "toxics sample", run_toxics_sample),
+    ("criteria_daily", "criteria daily", run_criteria_daily),
+    ("dim_sites", "sites dimension", run_dim_sites),
+    ("dim_pollutant", "pollutant dimension", run_dim_pollutant),
+]
+
 
 def run_all_staging():
     """Run all staging consolidation pipelines."""
@@ -44,54 +55,27 @@ def run_all_staging():
     # Track success/failure of each pipeline
     results = {}
     
-    # 1. Run toxics annual staging
-    print("1️⃣  Running Toxics Annual Staging...")
-    try:
-        run_toxics_annual()
-        results["toxics_annual"] = "✅ SUCCESS"
-    except Exception as e:
-        print(f"❌ Error in toxics annual staging: {e}")
-        results["toxics_annual"] = f"❌ FAILED: {e}"
-    print()
-    
-    # 2. Run toxics sample staging
-    print("2️⃣  Running Toxics Sample Staging...")
-    try:
-        run_toxics_sample()
-        results["toxics_sample"] = "✅ SUCCESS"
-    except Exception as e:
-        print(f"❌ Error in toxics sample staging: {e}")
-        results["toxics_sample"] = f"❌ FAILED: {e}"
-    print()
-    
-    # 3. Run criteria daily staging
-    print("3️⃣  Running Criteria Daily Staging...")
-    try:
-        run_criteria_daily()
-        results["criteria_daily"] = "✅ SUCCESS"
-    except Exception as e:
-        print(f"❌ Error in criteria daily staging: {e}")
-        results["criteria_daily"] = f"❌ FAILED: {e}"
-    print()
-    
-    # 4. Run site dimension staging
-    print("4️⃣  Running Sites Dimension Staging...")
-    try:
-        run_dim_sites()
-        results["dim_sites"] = "✅ SUCCESS"
-    except Exception as e:
-        print(f"❌ Error in sites dimension staging: {e}")
-        results["dim_sites"] = f"❌ FAILED: {e}"
-    print()
-    
-    # 5. Run pollutant dimension staging
-    print("5️⃣  Running Pollutant Dimension Staging...")
-    try:
-        run_dim_pollutant()
-        results["dim_pollutant"] = "✅ SUCCESS"
-    except Exception as e:
-        print(f"❌ Error in pollutant dimension staging: {e}")
-        results["dim_pollutant"] = f"❌ FAILED: {e}"
+    # 1-5. Run the independent fact/dimension stagings concurrently. Each reads
+    # its own transform inputs and writes its own staged directory, so total wall
+    # time approaches the slowest stage. The design value stages below read
+    # staged criteria daily output and therefore still run afterwards.
+    print("1️⃣  Running Toxics, Criteria Daily, Sites and Pollutant Staging concurrently...")
+    max_workers = min(len(INDEPENDENT_STAGES), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(func): (name, label)
+            for name, label, func in INDEPENDENT_STAGES
+        }
+        for future in as_completed(futures):
+            name, label = futures[future]
+            try:
+                future.result()
+                results[name] = "✅ SUCCESS"
+            except Exception as e:
+                print(f"❌ Error in {label} staging: {e}")
+                results[name] = f"❌ FAILED: {e}"
+    # Keep the summary in pipeline order regardless of completion order
+    results = {name: results[name] for name, _, _ in INDEPENDENT_STAGES}
     print()
 
     # 6. Run PM2.5 hourly staging
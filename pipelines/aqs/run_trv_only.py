@@ -7,7 +7,7 @@ Assumes extraction has already been completed.
 
 from __future__ import annotations
 
-import glob
+import os
 import sys
 from pathlib import Path
 
@@ -23,6 +23,18 @@ from aqs.transformers.trv_sample import transform_toxics_trv
 from loaders.filesystem import write_csv
 
 
+def _list_year_files(directory: Path, prefix: str) -> list[str]:
+    """Return paths of `{prefix}*.csv` files in `directory` via a single scandir pass."""
+    if not directory.exists():
+        return []
+    with os.scandir(directory) as entries:
+        return [
+            entry.path
+            for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(".csv")
+        ]
+
+
 def main():
     # Paths
     dim_trv_path = ROOT / "ops" / "dimPollutant.csv"
@@ -36,7 +48,7 @@ def main():
 
     print("Starting TRV transformation for sample toxics data...")
     # Process sample toxics
-    sample_toxics_files = glob.glob(str(sample_dir / "aqs_sample_toxics_*.csv"))
+    sample_toxics_files = _list_year_files(sample_dir, "aqs_sample_toxics_")
     for toxics_file in sample_toxics_files:
         year = toxics_file.split("_")[-1].replace(".csv", "")
         print(f"Processing sample toxics for {year}...")
@@ -53,7 +65,7 @@ def main():
 
     print("Starting TRV transformation for annual toxics data...")
     # Process annual toxics
-    annual_toxics_files = glob.glob(str(annual_dir / "aqs_annual_toxics_*.csv"))
+    annual_toxics_files = _list_year_files(annual_dir, "aqs_annual_toxics_")
     for annual_file in annual_toxics_files:
         year = annual_file.split("_")[-1].replace(".csv", "")
         print(f"Processing annual toxics for {year}...")
@@ -25,7 +25,8 @@ import config
 from logging_config import (
      setup_logging, get_logger, log_pipeline_start, 
      log_error_with_context, log_pipeline_end)
-from loaders.filesystem import write_csv
+from loaders.filesystem import write_csv, write_parquet
+from envista import _env_client
 from envista.extractors.monitors import extract_envista_station_data
 from envista.extractors.measurements import get_envista_hourly, get_envista_daily
 
@@ -47,6 +48,12 @@ _combined_daily_results: dict[str, pd.DataFrame] = {}  # Key format: "year"
 
 if BDATE < date(2018, 7, 1): BDATE = date(2018, 7, 1)  # Envista data starts mid-2018
 
+
+def _init_session() -> None:
+    """Give each site worker thread its own pooled Envista session."""
+    _session_local.session = _env_client.make_session()
+
+
 def _process_site_year(
     station_name: str, station_id: str, channel_name: str, channel_id: str, year: str
 ) -> tuple[str, str, str, int, int, bool]:
@@ -62,19 +69,18 @@ def _process_site_year(
     logger.debug(f"Extracting hourly data for {station_name}:{channel_name}, {station_id}:{channel_id} in {year}")
 
     try:
+        session = getattr(_session_local, "session", None)
         envista_data_hourly = get_envista_hourly(
             station_id=station_id,
             channel_id=channel_id,
             from_date=from_date,
-            to_date=to_date
+            to_date=to_date,
+            session=session,
         )
 
         if envista_data_hourly is not None and not envista_data_hourly.empty:
-            # Check if DataFrame has any all-NA columns
-            all_na_cols = envista_data_hourly.columns[envista_data_hourly.isna().all()].tolist()
-            
-            # Skip if all columns are NA
-            if len(all_na_cols) == len(envista_data_hourly.columns):
+            # Skip if every cell is NA
+            if envista_data_hourly.isna().values.all():
                 logger.warning(
                     f"No data for {station_name}:{station_id}, {channel_name}:{channel_id} in {year}."
                 )
@@ -84,7 +90,8 @@ def _process_site_year(
                 station_id=station_id,
                 channel_id=channel_id,
                 from_date=from_date,
-                to_date=to_date
+                to_date=to_date,
+                session=session,
             )
             
             hourly_rows = len(envista_data_hourly)
@@ -139,7 +146,9 @@ def _process_year_concurrent(
     year_hourly_total_rows = 0
     year_daily_total_rows = 0
 
-    with ThreadPoolExecutor(max_workers=site_workers) as executor:
+    with ThreadPoolExecutor(
+        max_workers=site_workers, initializer=_init_session
+    ) as executor:
         futures = [
             executor.submit(
                 _process_site_year,
@@ -196,7 +205,7 @@ def _process_sample_service_concurrent(
     logger.info(f"Sample service complete: {total_hourly_rows} total hourly rows and "
                 f"{total_daily_rows} total daily rows extracted.")
 
-    # Write combined results to CSV files by year
+    # Write combined results to parquet files by year
     config.ensure_dirs(ENV_SAMPLE_DIR)
     
     # Write year-based files for hourly data
@@ -205,34 +214,31 @@ def _process_sample_service_concurrent(
             logger.warning(f"Skipping year {year}: DataFrame is empty")
             continue
         
-        # Check if all columns are NA
-        all_na_cols = df.columns[df.isna().all()].tolist()
-        if len(all_na_cols) == len(df.columns):
+        # Check if every cell is NA
+        if df.isna().values.all():
             logger.warning(
                 f"Skipping year {year}: All columns contain only NA values"
             )
             continue
-        config.ensure_dirs(ENV_SAMPLE_DIR)
-        output_file = ENV_SAMPLE_DIR / f"env_hourly_pm25_{year}.csv"
-        write_csv(df, output_file)
+        output_file = ENV_SAMPLE_DIR / f"env_hourly_pm25_{year}.parquet"
+        write_parquet(df, output_file)
         logger.info(f"Exported {len(df)} rows for year {year} to {output_file}")
     
     # Write year-based files for daily data
+    config.ensure_dirs(ENV_DAILY_DIR)
     for year, df in _combined_daily_results.items():
         if df.empty:
             logger.warning(f"Skipping year {year} daily data: DataFrame is empty")
             continue
         
-        # Check if all columns are NA
-        all_na_cols = df.columns[df.isna().all()].tolist()
-        if len(all_na_cols) == len(df.columns):
+        # Check if every cell is NA
+        if df.isna().values.all():
             logger.warning(
                 f"Skipping year {year} daily data: All columns contain only NA values"
             )
             continue
-        config.ensure_dirs(ENV_DAILY_DIR)
-        output_file = ENV_DAILY_DIR / f"env_daily_pm25_{year}.csv"
-        write_csv(df, output_file)
+        output_file = ENV_DAILY_DIR / f"env_daily_pm25_{year}.parquet"
+        write_parquet(df, output_file)
         logger.info(f"Exported {len(df)} daily rows for year {year} to {output_file}")
 
     print(f"\n[COMPLETE] SAMPLE SERVICE COMPLETE: {total_hourly_rows} total hourly rows and "
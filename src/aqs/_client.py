@@ -7,73 +7,168 @@ calendar-year chunks used by several AQS services.
 
 from __future__ import annotations
 
+import atexit
+import csv
+import hashlib
 import json
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
 import time
+import zlib
 from collections import deque
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
-from threading import Lock
-from typing import Tuple
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
+from threading import BoundedSemaphore, Lock, Semaphore
+from urllib.parse import parse_qs, urlencode, urlparse
 
 import pandas as pd
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 
 import config
+from logging_config import get_logger
 
-# Simple global rate limiter state
-_last_request_time = 0.0
-_rate_lock = Lock()
-_request_timestamps: deque[float] = deque()
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import ijson
+except ModuleNotFoundError:  # pragma: no cover - optional streaming parser
+    ijson = None
+
+logger = get_logger("aqs.client")
+
+# Rate limiter defaults; each host gets its own bucket (see HostLimiter)
 _min_delay_seconds = float(getattr(config, "AQS_MIN_DELAY", 0.0))
 _max_requests_per_second = int(getattr(config, "AQS_MAX_RPS", 5))
+_HOST_RPS: dict[str, int] = dict(getattr(config, "AQS_HOST_RPS", {}) or {})
+_WINDOW_NS = 1_000_000_000
+
+# In-flight request cap; while throttled (after a 429) only one probe is in flight
+_INFLIGHT_LIMIT = max(1, int(getattr(config, "AQS_MAX_INFLIGHT", 8)))
+_inflight_sem = BoundedSemaphore(_INFLIGHT_LIMIT)
+_probe_sem = Semaphore(1)
+_throttle_mode = False
 
 # Retry/backoff configuration (read from env or use defaults)
 _AQS_RETRIES = int(getattr(config, "AQS_RETRIES", 6))
+# 429s are budgeted separately so throttling can't exhaust the error retries
+_THROTTLE_RETRIES = int(getattr(config, "AQS_THROTTLE_RETRIES", 20))
 _BACKOFF_FACTOR = float(getattr(config, "AQS_BACKOFF_FACTOR", 1.0))
 _RETRY_MAX_WAIT = int(getattr(config, "AQS_RETRY_MAX_WAIT", 30))
 _DEFAULT_TIMEOUT = int(getattr(config, "AQS_TIMEOUT", 30))
+_CHUNK_WORKERS = max(1, int(getattr(config, "AQS_CHUNK_WORKERS", 3)))
+_MAX_RETRY_AFTER = int(getattr(config, "AQS_MAX_RETRY_AFTER", 60))
+_EMPTY_CACHE_TTL = int(getattr(config, "AQS_EMPTY_CACHE_TTL", 7 * 24 * 3600))
+_RESPONSE_CACHE_TTL = int(getattr(config, "AQS_RESPONSE_CACHE_TTL", 0))
+# Write buffer for streamed CSV output (bytes)
+_CSV_WRITE_BUFFER = 1 << 20
+# Independently seeded so concurrent retriers don't share a jitter phase
+_rng = random.Random(os.urandom(8))
 
 # Circuit-breaker configuration
 _CIRCUIT_THRESHOLD = int(config.__dict__.get("AQS_CIRCUIT_THRESHOLD", 5))
 _CIRCUIT_COOLDOWN = int(config.__dict__.get("AQS_CIRCUIT_COOLDOWN", 1800))  # seconds
 
+# In-memory circuit state; flushed to aqs_health.json only when it changes
+_health_lock = Lock()
+_health_state: dict | None = None
+_health_dirty = False
+_last_health_flush = 0.0
+_HEALTH_FLUSH_INTERVAL = 1.0
+# (opened_at string, parsed datetime) so the timestamp is parsed once per transition
+_opened_at_cache: tuple[str, datetime | None] | None = None
 
-def _sleep_if_needed() -> None:
-    """Enforce request pacing to honor AQS limits while allowing concurrency."""
-    global _last_request_time
 
-    if _max_requests_per_second <= 0:
-        return
+class QuotaExhaustedError(RuntimeError):
+    """Raised when AQS asks us to back off longer than AQS_MAX_RETRY_AFTER."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(
+            f"AQS quota exhausted; server asked to retry after {retry_after}s"
+        )
+        self.retry_after = retry_after
 
-    with _rate_lock:
-        now = time.monotonic()
 
-        # Enforce optional minimum delay between successive requests
-        if _min_delay_seconds > 0:
-            elapsed = now - _last_request_time
-            if elapsed < _min_delay_seconds:
-                time.sleep(_min_delay_seconds - elapsed)
-                now = time.monotonic()
-
-        # Drop timestamps older than one-second window
-        window_start = now - 1.0
-        while _request_timestamps and _request_timestamps[0] < window_start:
-            _request_timestamps.popleft()
-
-        # If we're at capacity, wait until the earliest request expires
-        if len(_request_timestamps) >= _max_requests_per_second:
-            earliest = _request_timestamps[0]
-            wait = 1.0 - (now - earliest)
-            if wait > 0:
-                time.sleep(wait)
-                now = time.monotonic()
-                window_start = now - 1.0
-                while _request_timestamps and _request_timestamps[0] < window_start:
-                    _request_timestamps.popleft()
-
-        _request_timestamps.append(now)
-        _last_request_time = now
+class HostLimiter:
+    """Token bucket pacing requests to a single host.
+
+    Credit is kept in integer nanoseconds: elapsed time refills it up to one
+    second's worth and each request spends one ``1s / max_rps`` interval.
+    """
+
+    def __init__(self, max_rps: int, min_delay: float = 0.0):
+        self.max_rps = max_rps
+        self.min_delay_ns = int(min_delay * 1_000_000_000)
+        self.interval_ns = _WINDOW_NS // max(max_rps, 1)
+        self.bucket_ns = self.interval_ns * max(max_rps, 1)
+        self.credit_ns = self.bucket_ns
+        self.last_refill_ns = time.monotonic_ns()
+        self.last_request_ns = 0
+        self.lock = Lock()
+
+    def acquire(self) -> None:
+        """Block until a request to this host may be sent."""
+        if self.max_rps <= 0:
+            return
+
+        while True:
+            with self.lock:
+                now = time.monotonic_ns()
+
+                # Enforce optional minimum delay between successive requests
+                wait_ns = 0
+                if self.min_delay_ns:
+                    wait_ns = self.min_delay_ns - (now - self.last_request_ns)
+
+                self.credit_ns = min(
+                    self.bucket_ns, self.credit_ns + (now - self.last_refill_ns)
+                )
+                self.last_refill_ns = now
+                if self.credit_ns < self.interval_ns:
+                    wait_ns = max(wait_ns, self.interval_ns - self.credit_ns)
+
+                if wait_ns <= 0:
+                    self.credit_ns -= self.interval_ns
+                    self.last_request_ns = now
+                    return
+            # Sleep outside the lock so other threads can refill/consume meanwhile
+            time.sleep(wait_ns / 1e9)
+
+
+_limiters: dict[str, HostLimiter] = {}
+_limiters_lock = Lock()
+
+
+def _get_limiter(host: str) -> HostLimiter:
+    limiter = _limiters.get(host)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(host)
+            if limiter is None:
+                limiter = HostLimiter(
+                    _HOST_RPS.get(host, _max_requests_per_second), _min_delay_seconds
+                )
+                _limiters[host] = limiter
+    return limiter
+
+
+def _sleep_if_needed(host: str = "aqs.epa.gov") -> None:
+    """Enforce request pacing for ``host`` while allowing concurrency."""
+    _get_limiter(host).acquire()
 
 
 def _health_path() -> str:
@@ -81,7 +176,7 @@ def _health_path() -> str:
     return str(config.CTL_DIR / "aqs_health.json")
 
 
-def _read_health() -> dict:
+def _load_health() -> dict:
     path = _health_path()
     try:
         with open(path, encoding="utf-8") as fh:
@@ -90,46 +185,112 @@ def _read_health() -> dict:
         return {"consecutive_failures": 0, "opened_at": None}
 
 
+def _read_health() -> dict:
+    """Return the cached circuit state, loading it from disk on first use."""
+    global _health_state
+    with _health_lock:
+        if _health_state is None:
+            _health_state = _load_health()
+        return dict(_health_state)
+
+
 def _write_health(state: dict) -> None:
+    """Replace the cached circuit state and persist it immediately."""
+    global _health_state, _health_dirty
+    with _health_lock:
+        _health_state = dict(state)
+        _health_dirty = True
+    _flush_health(force=True)
+
+
+def _flush_health(force: bool = False) -> None:
+    """Persist the cached circuit state if it changed since the last write.
+
+    Writes are coalesced to at most one per ``_HEALTH_FLUSH_INTERVAL`` seconds
+    unless ``force`` is set; pending state is always flushed at interpreter exit.
+    """
     from loaders.filesystem import atomic_write_json
 
-    path = _health_path()
-    atomic_write_json(path, state)
+    global _health_dirty, _last_health_flush
+    with _health_lock:
+        if not _health_dirty or _health_state is None:
+            return
+        now = time.monotonic()
+        if not force and now - _last_health_flush < _HEALTH_FLUSH_INTERVAL:
+            return
+        snapshot = dict(_health_state)
+        _health_dirty = False
+        _last_health_flush = now
+    atomic_write_json(_health_path(), snapshot)
 
 
 def _open_circuit() -> None:
-    state = _read_health()
-    state["consecutive_failures"] = state.get("consecutive_failures", 0) + 1
-    # Only set opened_at when we actually hit the threshold
-    if state["consecutive_failures"] >= _CIRCUIT_THRESHOLD and not state.get("opened_at"):
-        state["opened_at"] = datetime.now(timezone.utc).isoformat()
-        print(f"\n⚠️  CIRCUIT BREAKER OPENED after {state['consecutive_failures']} consecutive failures")
-        print(f"   Will block requests for {_CIRCUIT_COOLDOWN}s to prevent hammering AQS\n")
-    _write_health(state)
+    global _health_state, _health_dirty
+    opened = False
+    with _health_lock:
+        if _health_state is None:
+            _health_state = _load_health()
+        state = _health_state
+        state["consecutive_failures"] = state.get("consecutive_failures", 0) + 1
+        # Only set opened_at when we actually hit the threshold
+        if state["consecutive_failures"] >= _CIRCUIT_THRESHOLD and not state.get("opened_at"):
+            state["opened_at"] = datetime.now(timezone.utc).isoformat()
+            opened = True
+        _health_dirty = True
+        failures = state["consecutive_failures"]
+    if opened:
+        logger.warning(
+            "⚠️  CIRCUIT BREAKER OPENED after %d consecutive failures; "
+            "blocking requests for %ds to prevent hammering AQS",
+            failures,
+            _CIRCUIT_COOLDOWN,
+        )
+    # Opening the circuit is persisted right away so other runs see it
+    _flush_health(force=opened)
 
 
 def _reset_circuit() -> None:
-    state = _read_health()
-    if state.get("consecutive_failures", 0) == 0 and not state.get("opened_at"):
-        return
-    _write_health({"consecutive_failures": 0, "opened_at": None})
+    global _health_state, _health_dirty
+    with _health_lock:
+        if _health_state is None:
+            _health_state = _load_health()
+        if _health_state.get("consecutive_failures", 0) == 0 and not _health_state.get("opened_at"):
+            return
+        _health_state = {"consecutive_failures": 0, "opened_at": None}
+        _health_dirty = True
+    _flush_health()
+
+
+def _parse_opened_at(opened_at: str) -> datetime | None:
+    """Parse ``opened_at`` as tz-aware UTC, reusing the last parse if unchanged."""
+    global _opened_at_cache
+    cached = _opened_at_cache
+    if cached is not None and cached[0] == opened_at:
+        return cached[1]
+    try:
+        opened = datetime.fromisoformat(opened_at)
+        # normalize to tz-aware UTC (fromisoformat returns naive on Python <=3.10)
+        if opened.tzinfo is None:
+            opened = opened.replace(tzinfo=timezone.utc)
+    except Exception:
+        opened = None
+    _opened_at_cache = (opened_at, opened)
+    return opened
 
 
 def circuit_is_open() -> bool:
+    if _health_dirty:
+        _flush_health()
     state = _read_health()
     opened_at = state.get("opened_at")
     failures = state.get("consecutive_failures", 0)
     if not opened_at:
         return False
-    try:
-        opened = datetime.fromisoformat(opened_at)
-        # normalize to tz-aware UTC (fromisoformat returns naive on Python <=3.10)
-        if opened.tzinfo is None:
-            opened = opened.replace(tzinfo=timezone.utc)
-    except Exception:
-        return False
     if failures < _CIRCUIT_THRESHOLD:
         return False
+    opened = _parse_opened_at(opened_at)
+    if opened is None:
+        return False
     # if still within cooldown window, circuit remains open
     if datetime.now(timezone.utc) < opened + timedelta(seconds=_CIRCUIT_COOLDOWN):
         return True
@@ -137,6 +298,150 @@ def circuit_is_open() -> bool:
     return False
 
 
+atexit.register(_flush_health, force=True)
+
+
+class EmptyResultCache:
+    """Persistent record of AQS requests known to return no rows.
+
+    Entries live in a small SQLite table under CTL_DIR and expire after
+    AQS_EMPTY_CACHE_TTL seconds so late-arriving data is picked up again.
+    As with ResponseCache, only requests whose end date falls in an earlier
+    calendar year are cached; current-year data may still be published. A
+    TTL of 0 disables the cache.
+    """
+
+    def __init__(self, path: Path | str | None = None, ttl: int = _EMPTY_CACHE_TTL):
+        self._path = path
+        self.ttl = ttl
+        self._conn: sqlite3.Connection | None = None
+        self._lock = Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self._path is None:
+                config.CTL_DIR.mkdir(parents=True, exist_ok=True)
+                self._path = config.CTL_DIR / "aqs_empty_cache.db"
+            self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS empty_results (key TEXT PRIMARY KEY, ts INTEGER)"
+            )
+        return self._conn
+
+    @staticmethod
+    def cacheable(key: str) -> bool:
+        # Keys end in the request's YYYYMMDD edate
+        edate = key.rsplit("|", 1)[-1]
+        return edate[:4].isdigit() and int(edate[:4]) < date.today().year
+
+    def contains(self, key: str) -> bool:
+        if self.ttl <= 0 or not self.cacheable(key):
+            return False
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT ts FROM empty_results WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None and time.time() - row[0] < self.ttl
+
+    def put(self, key: str) -> None:
+        if self.ttl <= 0 or not self.cacheable(key):
+            return
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO empty_results (key, ts) VALUES (?, ?)",
+                (key, int(time.time())),
+            )
+            conn.commit()
+
+
+empty_cache = EmptyResultCache()
+
+
+class ResponseCache:
+    """Persistent, compressed copy of AQS JSON bodies for past-year requests.
+
+    Bodies are zlib-compressed in a SQLite table under CTL_DIR, keyed by a
+    SHA-256 of the URL so credentials are never stored. Only requests whose
+    ``edate`` falls in an earlier calendar year are cached, and entries expire
+    after AQS_RESPONSE_CACHE_TTL seconds. A TTL of 0 (the default) disables it.
+    """
+
+    def __init__(self, path: Path | str | None = None, ttl: int = _RESPONSE_CACHE_TTL):
+        self._path = path
+        self.ttl = ttl
+        self._conn: sqlite3.Connection | None = None
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self._path is None:
+                config.CTL_DIR.mkdir(parents=True, exist_ok=True)
+                self._path = config.CTL_DIR / "aqs_response_cache.db"
+            self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, ts INTEGER, body BLOB)"
+            )
+        return self._conn
+
+    @staticmethod
+    def cacheable(url: str) -> bool:
+        edate = parse_qs(urlparse(url).query).get("edate", [""])[0]
+        return edate[:4].isdigit() and int(edate[:4]) < date.today().year
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> bytes | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT ts, body FROM responses WHERE key = ?", (self._key(url),)
+            ).fetchone()
+        if row is None or time.time() - row[0] >= self.ttl:
+            return None
+        return zlib.decompress(row[1])
+
+    def put(self, url: str, body: bytes) -> None:
+        if not self.enabled:
+            return
+        blob = zlib.compress(body)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, ts, body) VALUES (?, ?, ?)",
+                (self._key(url), int(time.time()), blob),
+            )
+            conn.commit()
+
+    def get_json(self, url: str):
+        """Return the cached, decoded body for ``url``, or None on a miss."""
+        if not (self.enabled and self.cacheable(url)):
+            return None
+        body = self.get(url)
+        return None if body is None else _loads(body)
+
+    def put_json(self, url: str, body, js) -> None:
+        """Store ``body`` for ``url`` if it is cacheable and ``js`` is a complete answer."""
+        if not (self.enabled and self.cacheable(url)):
+            return
+        if not isinstance(body, (bytes, bytearray)):
+            return
+        # Only keep complete answers; failed requests also come back as 200s
+        if _header_status(js) in _CONFIRMED_EMPTY_STATUSES:
+            self.put(url, bytes(body))
+
+
+response_cache = ResponseCache()
+
+
 def make_session(timeout: int | None = None) -> requests.Session:
     """Create a requests.Session and wrap requests with rate limiting.
 
@@ -146,6 +451,14 @@ def make_session(timeout: int | None = None) -> requests.Session:
     """
     session = requests.Session()
     session.headers.update({"User-Agent": "soar-pipeline/1.0"})
+
+    # Keep-alive pool large enough for every in-flight request, so parallel
+    # chunk fetches reuse TCP/TLS connections instead of re-handshaking
+    pool_size = max(_INFLIGHT_LIMIT, _CHUNK_WORKERS)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
     session.request = _wrap_request_with_rate(session.request)
     session.timeout = timeout if timeout is not None else _DEFAULT_TIMEOUT
     return session
@@ -153,12 +466,24 @@ def make_session(timeout: int | None = None) -> requests.Session:
 
 def _wrap_request_with_rate(func):
     def wrapped(method, url, *args, **kwargs):
-        _sleep_if_needed()
+        # Pace per host so non-AQS traffic never waits on AQS's bucket
+        _sleep_if_needed(urlparse(url).netloc)
         return func(method, url, *args, **kwargs)
 
     return wrapped
 
 
+@contextmanager
+def _request_slot() -> Iterator[None]:
+    """Hold an in-flight permit, narrowing to a single probe while throttled."""
+    with _inflight_sem:
+        if _throttle_mode:
+            with _probe_sem:
+                yield
+        else:
+            yield
+
+
 def _parse_retry_after(resp) -> int | None:
     header = resp.headers.get("Retry-After")
     if not header:
@@ -170,21 +495,56 @@ def _parse_retry_after(resp) -> int | None:
         try:
             # If it's an HTTP date
             t = parsedate_to_datetime(header)
-            return max(0, int((t - datetime.utcnow()).total_seconds()))
+            if t.tzinfo is None:
+                t = t.replace(tzinfo=timezone.utc)
+            return max(0, int((t - datetime.now(timezone.utc)).total_seconds()))
         except Exception:
             return None
 
 
+def _decode_json(resp):
+    """Decode a response body, using orjson on the raw bytes when available."""
+    content = getattr(resp, "content", None)
+    if orjson is not None and isinstance(content, (bytes, bytearray)):
+        return orjson.loads(content)
+    return resp.json()
+
+
+def _loads(body: bytes):
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+# Errors from ``decode`` that mean the body was not valid (or complete) JSON
+_DECODE_ERRORS = (ValueError,) if ijson is None else (ValueError, ijson.JSONError)
+
+
+def _try_decode(resp, decode):
+    """Return ``(True, decode(resp))``, or ``(False, exc)`` for an invalid body."""
+    try:
+        return True, decode(resp)
+    except _DECODE_ERRORS as exc:
+        return False, exc
+
+
+def _decode_streamed(resp, decode):
+    """Check the status of a streamed response, then decode and close it."""
+    try:
+        resp.raise_for_status()
+        return _try_decode(resp, decode)
+    except urllib3.exceptions.HTTPError as exc:
+        # Read errors on the raw socket are not wrapped by requests
+        raise requests.exceptions.ConnectionError(exc) from exc
+    finally:
+        resp.close()
+
+
 def _sleep_backoff(attempt: int, retry_after: int | None = None) -> None:
     if retry_after is not None:
         wait = min(retry_after, _RETRY_MAX_WAIT)
     else:
-        # exponential backoff with jitter
+        # exponential backoff with decorrelating jitter in [0.5, 1.5) x base
         base = _BACKOFF_FACTOR * (2**attempt)
-        jitter = base * 0.1
-        wait = min(_RETRY_MAX_WAIT, base + (jitter * (2 * (time.time() % 1) - 1)))
-        if wait < 0:
-            wait = 0
+        wait = min(_RETRY_MAX_WAIT, _rng.uniform(base * 0.5, base * 1.5))
     time.sleep(wait)
 
 
@@ -192,39 +552,104 @@ def fetch_json(session: requests.Session, url: str) -> dict:
     """Fetch JSON with Retry-After and circuit-breaker awareness.
 
     Raises on HTTP errors. On repeated server errors this will open the
-    circuit (persisted) to avoid hammering AQS.
+    circuit (persisted) to avoid hammering AQS. A 429 whose Retry-After exceeds
+    AQS_MAX_RETRY_AFTER raises QuotaExhaustedError immediately; shorter 429s are
+    retried up to AQS_THROTTLE_RETRIES times without using the AQS_RETRIES budget.
+    """
+    js = response_cache.get_json(url)
+    if js is not None:
+        return js
+    if not (response_cache.enabled and response_cache.cacheable(url)):
+        return _fetch_with_retries(session, url, _decode_json)
+
+    # Decode inside the retry loop so invalid bodies are retried on this path too
+    body, js = _fetch_with_retries(
+        session, url, lambda resp: (resp.content, _decode_json(resp))
+    )
+    response_cache.put_json(url, body, js)
+    return js
+
+
+def _fetch_with_retries(
+    session: requests.Session,
+    url: str,
+    decode: Callable[[requests.Response], object],
+    stream: bool = False,
+):
+    """Run the retry/circuit-breaker loop and return ``decode(resp)`` on success.
+
+    A ValueError (or ijson parse error) from ``decode`` is treated as a
+    transient invalid-JSON error. With ``stream`` the body is read inside
+    ``decode`` while the in-flight permit is still held, and a connection
+    dropped mid-body is retried like any other request error.
     """
     # If circuit is currently open, raise early to let callers fallback/abort
     if circuit_is_open():
         raise RuntimeError("AQS circuit is open; skipping external requests")
 
+    global _throttle_mode
+
     last_exc = None
-    for attempt in range(_AQS_RETRIES + 1):
+    attempt = 0
+    throttle_attempt = 0
+    while True:
         try:
-            resp = session.get(
-                url, timeout=getattr(session, "timeout", _DEFAULT_TIMEOUT)
-            )
+            get_kwargs = {"timeout": getattr(session, "timeout", _DEFAULT_TIMEOUT)}
+            if stream:
+                get_kwargs["stream"] = True
+            decoded = None
+            with _request_slot():
+                resp = session.get(url, **get_kwargs)
+                if stream and resp.status_code != 429:
+                    # A streamed body is read by decode, so the permit is held
+                    # until the whole body has been consumed
+                    decoded = _decode_streamed(resp, decode)
             # if service tells us to slow down, honor it
             if resp.status_code == 429:
+                _throttle_mode = True
                 retry_after = _parse_retry_after(resp)
-                if attempt < _AQS_RETRIES:
-                    print(f"  ⏳ Rate limited (429), waiting {retry_after or 'default'}s before retry {attempt+1}/{_AQS_RETRIES}")
-                    _sleep_backoff(attempt, retry_after=retry_after)
+                if stream:
+                    # The body is never read, so release the pooled connection
+                    resp.close()
+                # A long quota reset can't be waited out with short retries
+                if retry_after is not None and retry_after > _MAX_RETRY_AFTER:
+                    logger.warning(
+                        "🛑 Rate limited (429) with Retry-After %ss, deferring request",
+                        retry_after,
+                    )
+                    raise QuotaExhaustedError(retry_after)
                 last_exc = requests.exceptions.RetryError("429 Too Many Requests")
+                if throttle_attempt >= _THROTTLE_RETRIES:
+                    break
+                throttle_attempt += 1
+                logger.warning(
+                    "⏳ Rate limited (429), waiting %ss before retry %d/%d",
+                    retry_after if retry_after is not None else "default",
+                    throttle_attempt,
+                    _THROTTLE_RETRIES,
+                )
+                _sleep_backoff(max(attempt, throttle_attempt - 1), retry_after=retry_after)
                 continue
             resp.raise_for_status()
-            # success -> reset circuit
+            # success -> leave throttle mode and reset circuit
+            _throttle_mode = False
             _reset_circuit()
-            try:
-                return resp.json()
-            except ValueError as json_exc:
-                # AQS returned invalid JSON - treat as transient error
-                if attempt < _AQS_RETRIES:
-                    print(f"  ⚠️  Invalid JSON response, retrying {attempt+1}/{_AQS_RETRIES}")
-                    _sleep_backoff(attempt)
-                    last_exc = json_exc
-                    continue
-                raise json_exc
+            if decoded is None:
+                decoded = _try_decode(resp, decode)
+            ok, value = decoded
+            if ok:
+                return value
+            # AQS returned invalid or truncated JSON - treat as transient error
+            json_exc = value
+            if attempt < _AQS_RETRIES:
+                logger.warning(
+                    "⚠️  Invalid JSON response, retrying %d/%d", attempt + 1, _AQS_RETRIES
+                )
+                _sleep_backoff(max(attempt, throttle_attempt))
+                last_exc = json_exc
+                attempt += 1
+                continue
+            raise json_exc
         except requests.exceptions.RequestException as exc:
             last_exc = exc
             # Only increment circuit on server errors (5xx), not client errors (4xx)
@@ -236,10 +661,12 @@ def fetch_json(session: requests.Session, url: str) -> dict:
             if status and 500 <= status < 600:
                 _open_circuit()
                 if attempt < _AQS_RETRIES:
-                    print(f"  ❌ Server error ({status}), retrying {attempt+1}/{_AQS_RETRIES}")
+                    logger.warning(
+                        "❌ Server error (%s), retrying %d/%d", status, attempt + 1, _AQS_RETRIES
+                    )
             elif status and 400 <= status < 500:
                 # Client errors (4xx) are not retriable - fail fast
-                print(f"  ❌ Client error ({status}), not retrying")
+                logger.error("❌ Client error (%s), not retrying", status)
                 raise exc
             # allow backoff and retry for transient errors
             retry_after = None
@@ -252,44 +679,250 @@ def fetch_json(session: requests.Session, url: str) -> dict:
             except Exception:
                 retry_after = None
             if attempt < _AQS_RETRIES:
-                _sleep_backoff(attempt, retry_after=retry_after)
+                _sleep_backoff(max(attempt, throttle_attempt), retry_after=retry_after)
+                attempt += 1
                 continue
             break
     # all retries exhausted
     if last_exc:
-        print(f"  💥 All retries exhausted, giving up on this request")
+        logger.error("💥 All retries exhausted, giving up on this request")
     raise RuntimeError("All retries exhausted with no recorded exception")
 
 
-def fetch_df(session: requests.Session, url: str) -> pd.DataFrame:
-    js = fetch_json(session, url)
-
-    data = []
+def _extract_records(js) -> list:
+    """Return the list of row dicts from an AQS JSON payload."""
     if isinstance(js, list):
         # Common pattern: [metadata, data]
         if len(js) > 1 and isinstance(js[1], list):
-            data = js[1]
-        elif js and isinstance(js[0], list):
-            data = js[0]
+            return js[1]
+        if js and isinstance(js[0], list):
+            return js[0]
     elif isinstance(js, dict):
         for key in ("Data", "data", "Results", "results", "rows"):
             value = js.get(key)
             if isinstance(value, list):
-                data = value
-                break
+                return value
+    return []
+
+
+def _header_status(js) -> str | None:
+    """Return the AQS ``Header[0].status`` value, if the payload has one."""
+    if isinstance(js, dict):
+        header = js.get("Header")
+        if isinstance(header, list) and header and isinstance(header[0], dict):
+            return header[0].get("status")
+    return None
+
 
-    if not data:
+# Header statuses that mean "the request worked and there is nothing there";
+# failed requests also come back with an empty Data array and must not be cached
+_CONFIRMED_EMPTY_STATUSES = frozenset({"Success", "No data matched your selection"})
+
+
+def is_confirmed_empty(status: str | None) -> bool:
+    """True if an empty AQS response with this header status is a real no-data result."""
+    return status in _CONFIRMED_EMPTY_STATUSES
+
+
+def records_to_frame(records: list) -> pd.DataFrame:
+    """Build a DataFrame from AQS row dicts, keeping the API's fields and order.
+
+    AQS rows in one response share the same keys, so values are pulled out as
+    tuples in one pass, which skips pandas' per-row dict key handling. Ragged
+    records fall back to ``DataFrame.from_records``.
+    """
+    if not records:
         return pd.DataFrame()
-    return pd.DataFrame(data)
+    if not isinstance(records[0], dict):
+        return pd.DataFrame.from_records(records)
+    columns = list(records[0])
+    width = len(columns)
+    if width > 1 and all(len(row) == width for row in records):
+        getter = itemgetter(*columns)
+        try:
+            return pd.DataFrame.from_records(
+                [getter(row) for row in records], columns=columns
+            )
+        except (KeyError, TypeError):
+            pass
+    return pd.DataFrame.from_records(records)
+
+
+def fetch_df(session: requests.Session, url: str) -> pd.DataFrame:
+    """Fetch an AQS request as a DataFrame; ``df.attrs["aqs_status"]`` holds the header status."""
+    js = fetch_json(session, url)
+    df = records_to_frame(_extract_records(js))
+    df.attrs["aqs_status"] = _header_status(js)
+    return df
+
+
+def fetch_df_parallel(
+    session: requests.Session, urls: Iterable[str], max_workers: int | None = None
+) -> Iterator[tuple[str, pd.DataFrame]]:
+    """Fetch several URLs concurrently, yielding ``(url, df)`` in input order.
+
+    At most ``max_workers`` requests (default AQS_CHUNK_WORKERS) are outstanding
+    at once, so a slow consumer never holds more than that many frames. Pacing
+    is still enforced by the shared rate limiter and in-flight semaphore.
+    """
+    workers = max(1, max_workers or _CHUNK_WORKERS)
+    url_iter = iter(urls)
+    if workers == 1:
+        for url in url_iter:
+            yield url, fetch_df(session, url)
+        return
 
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque(
+            (url, executor.submit(fetch_df, session, url))
+            for url in islice(url_iter, workers)
+        )
+        try:
+            while pending:
+                url, future = pending.popleft()
+                df = future.result()
+                next_url = next(url_iter, None)
+                if next_url is not None:
+                    pending.append((next_url, executor.submit(fetch_df, session, next_url)))
+                yield url, df
+        finally:
+            # Don't start queued chunks if the consumer stopped or a fetch failed
+            for _url, future in pending:
+                future.cancel()
+
+
+def _watch_header_status(events, header: dict):
+    # Pass ijson parse events through, recording Header[0].status on the way
+    for prefix, event, value in events:
+        if prefix == "Header.item.status" and "status" not in header:
+            header["status"] = value
+        yield prefix, event, value
+
+
+def _iter_data_rows(resp, header: dict | None = None) -> Iterator[dict]:
+    """Yield the rows of an AQS ``Data`` array from ``resp`` one at a time.
+
+    With ijson installed the body is parsed incrementally from the socket, so
+    memory stays flat regardless of response size. Without it the body is
+    decoded in full and its records are yielded. If ``header`` is given it
+    receives the response's ``Header[0].status`` under ``"status"``.
+    """
+    if ijson is None or getattr(resp, "raw", None) is None:
+        js = _decode_json(resp)
+        if header is not None:
+            header["status"] = _header_status(js)
+        yield from _extract_records(js)
+        return
+    resp.raw.decode_content = True
+    if header is None:
+        yield from ijson.items(resp.raw, "Data.item")
+    else:
+        events = _watch_header_status(ijson.parse(resp.raw), header)
+        yield from ijson.items(events, "Data.item")
 
-def build_year_chunks(start: date, end: date) -> Iterator[Tuple[str, str]]:
-    """Yield (bdate, edate) strings for each calendar-year chunk between start and end.
 
-    Returns strings in YYYYMMDD format.
+def _existing_csv_header(path: Path) -> list[str] | None:
+    """Return the header row of ``path``, or None if the file does not exist."""
+    try:
+        with open(path, newline="", encoding="utf-8") as fh:
+            return next(csv.reader(fh), None)
+    except FileNotFoundError:
+        return None
+
+
+def fetch_rows_to_csv(
+    session: requests.Session,
+    url: str,
+    out_path: Path | str,
+    header: dict | None = None,
+) -> int:
+    """Stream an AQS response into a CSV file and return the number of rows written.
+
+    Rows are first spooled to a temporary file next to ``out_path`` and only
+    appended once the whole body has parsed, so a dropped connection or a
+    truncated body never leaves a partial response in the output; the request
+    is retried from scratch instead. A header is written only when the file is
+    new; when appending, rows are aligned to the existing header. If ``header``
+    is given it receives the response's ``Header[0].status`` under ``"status"``.
     """
-    s = pd.to_datetime(start).date()
-    e = pd.to_datetime(end).date()
+    destination = Path(out_path)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    fd, spool_name = tempfile.mkstemp(
+        dir=destination.parent, prefix=f".{destination.name}.", suffix=".part"
+    )
+    os.close(fd)
+    spool_path = Path(spool_name)
+
+    def spool_rows(resp) -> tuple[int, list[str] | None]:
+        if header is not None:
+            header.pop("status", None)
+        rows = _iter_data_rows(resp, header=header)
+        first = next(rows, None)
+        if first is None:
+            return 0, None
+        fieldnames = _existing_csv_header(destination) or list(first.keys())
+        # Large write buffer so rows reach disk in few syscalls
+        with open(
+            spool_path, "w", newline="", encoding="utf-8", buffering=_CSV_WRITE_BUFFER
+        ) as fh:
+            writer = csv.DictWriter(fh, fieldnames=fieldnames, extrasaction="ignore")
+            writer.writerow(first)
+            written = 1
+            for row in rows:
+                writer.writerow(row)
+                written += 1
+        return written, fieldnames
+
+    try:
+        written, fieldnames = _fetch_with_retries(session, url, spool_rows, stream=True)
+        if not written:
+            return 0
+        with open(destination, "a", newline="", encoding="utf-8") as out:
+            if out.tell() == 0:
+                csv.writer(out).writerow(fieldnames)
+            with open(spool_path, newline="", encoding="utf-8") as spooled:
+                shutil.copyfileobj(spooled, out, _CSV_WRITE_BUFFER)
+        return written
+    finally:
+        spool_path.unlink(missing_ok=True)
+
+
+def credentials_query() -> str:
+    """Return the URL-encoded ``email=...&key=...`` query fragment for AQS requests."""
+    return _encode_credentials(config.AQS_EMAIL or "", config.AQS_KEY or "")
+
+
+@lru_cache(maxsize=4)
+def _encode_credentials(email: str, key: str) -> str:
+    return urlencode({"email": email, "key": key})
+
+
+def _as_date(value: date | str) -> date:
+    """Coerce a date, datetime, or YYYY-MM-DD / YYYYMMDD string to a date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value).strip()
+    if len(text) == 8 and text.isdigit():
+        return date(int(text[:4]), int(text[4:6]), int(text[6:]))
+    try:
+        return date.fromisoformat(text[:10])
+    except ValueError:
+        return pd.to_datetime(value).date()
+
+
+def build_year_chunks(start: date | str, end: date | str) -> tuple[tuple[str, str], ...]:
+    """Return (bdate, edate) strings for each calendar-year chunk between start and end.
+
+    Returns strings in YYYYMMDD format. Results are memoized per date range.
+    """
+    return _year_chunks(_as_date(start), _as_date(end))
+
+
+@lru_cache(maxsize=256)
+def _year_chunks(s: date, e: date) -> tuple[tuple[str, str], ...]:
+    chunks = []
     for year in range(s.year, e.year + 1):
         if year == s.year:
             b = s.strftime("%Y%m%d")
@@ -299,4 +932,5 @@ def build_year_chunks(start: date, end: date) -> Iterator[Tuple[str, str]]:
             ed = e.strftime("%Y%m%d")
         else:
             ed = f"{year}1231"
-        yield b, ed
+        chunks.append((b, ed))
+    return tuple(chunks)
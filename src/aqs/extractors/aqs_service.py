@@ -30,7 +30,9 @@ def fetch_samples_dispatch(
         return fetch_samples_by_state(
             parameter_code, bdate, edate, state_fips, session=session
         )
-    return fetch_samples_for_parameter(parameter_code, bdate, edate, state_fips)
+    return fetch_samples_for_parameter(
+        parameter_code, bdate, edate, state_fips, session=session
+    )
 
 
 __all__ = [
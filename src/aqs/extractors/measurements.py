@@ -11,7 +11,10 @@ added, modified, or removed. Write functions organize outputs by group_store and
 
 from __future__ import annotations
 
-from datetime import date
+import atexit
+import calendar
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlencode
 
@@ -19,23 +22,46 @@ import pandas as pd
 
 import config
 from aqs import _client
-from loaders.filesystem import append_csv
+from loaders.filesystem import AuditLogger, CsvAppender
+from utils import get_parameter_group
 
+# Memoized so repeat lookups for a parameter skip re-reading dimPollutant.csv
+_get_parameter_group = lru_cache(maxsize=None)(get_parameter_group)
 
-def _sanitize_filename(name: str, max_len: int = 80) -> str:
-    import re
+# Extraction audit records for this run, written as one JSON-lines file.
+# Pipelines flush it when they finish; the atexit hook is a fallback.
+AUDIT = AuditLogger(
+    Path(config.ROOT)
+    / "raw"
+    / "aqs"
+    / "logs"
+    / f"extract_audit_{datetime.now(timezone.utc):%Y-%m-%dT%H-%M-%SZ}.jsonl"
+)
+atexit.register(AUDIT.flush)
 
-    if not name:
-        return "unknown"
-    s = re.sub(r"\s+", "-", name)
-    s = re.sub(r"[^A-Za-z0-9._-]", "", s)
-    s = re.sub(r"[-_]{2,}", "-", s)
-    s = re.sub(r"(^[^A-Za-z0-9]+)|([^A-Za-z0-9]+$)", "", s)
-    if not s:
-        return "unknown"
-    if len(s) > max_len:
-        s = s[:max_len].rstrip("-_.")
-    return s
+# Output directories already created in this process
+_created_dirs: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create ``path`` (and parents) unless this process already did so."""
+    if path in _created_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _created_dirs.add(path)
+
+
+def _by_state_base(endpoint: str, parameter_code: str, state_fips: str) -> str:
+    """Return the ``{endpoint}/byState`` URL prefix shared by every date chunk.
+
+    The credentials are encoded once per process and the parameter and state
+    once per pull; callers append ``&bdate=...&edate=...`` (plain YYYYMMDD
+    digits, no quoting needed).
+    """
+    query = _client.credentials_query() + "&" + urlencode(
+        {"param": parameter_code, "state": state_fips}
+    )
+    return f"https://aqs.epa.gov/data/api/{endpoint}/byState?{query}"
 
 
 def _iter_sample_chunks(
@@ -48,17 +74,71 @@ def _iter_sample_chunks(
     """
 
     months_per_request = max(1, months_per_request)
-    start_ts = pd.to_datetime(bdate)
-    end_ts = pd.to_datetime(edate)
-    current_start = start_ts
-    month_offset = pd.DateOffset(months=months_per_request)
-
-    while current_start <= end_ts:
-        chunk_end = current_start + month_offset - pd.Timedelta(days=1)
-        if chunk_end > end_ts:
-            chunk_end = end_ts
+    current_start = _client._as_date(bdate)
+    end = _client._as_date(edate)
+    one_day = timedelta(days=1)
+
+    while current_start <= end:
+        # Advance by whole months, clamping the day to the target month's length
+        # (as pandas DateOffset does), then step back a day for the window end
+        month_index = current_start.month - 1 + months_per_request
+        year = current_start.year + month_index // 12
+        month = month_index % 12 + 1
+        day = min(current_start.day, calendar.monthrange(year, month)[1])
+        chunk_end = min(date(year, month, day) - one_day, end)
         yield current_start.strftime("%Y%m%d"), chunk_end.strftime("%Y%m%d")
-        current_start = chunk_end + pd.Timedelta(days=1)
+        current_start = chunk_end + one_day
+
+
+def _empty_key(
+    endpoint: str, parameter_code: str, state_fips: str, bdate: str, edate: str
+) -> str:
+    """Key for the known-empty result cache."""
+    return f"{endpoint}|{parameter_code}|{state_fips}|{bdate}|{edate}"
+
+
+def _fetch_by_state(
+    endpoint: str,
+    parameter_code: str,
+    bdate: date,
+    edate: date,
+    state_fips: str,
+    session=None,
+    months_per_request: int | None = None,
+):
+    """Fetch an AQS ``{endpoint}/byState`` pull chunk by chunk, yielding ``(year, df)``.
+
+    Chunks are calendar years, or ``months_per_request``-month windows within
+    each year when given. They are fetched concurrently and yielded in date
+    order; the year token preserves per-year file naming.
+    """
+    session = session or _client.make_session()
+    base = _by_state_base(endpoint, parameter_code, state_fips)
+    chunks = []
+    for year_b, year_e in _client.build_year_chunks(bdate, edate):
+        if months_per_request is None:
+            windows = [(year_b, year_e)]
+        else:
+            windows = _iter_sample_chunks(year_b, year_e, months_per_request)
+        for chunk_b, chunk_e in windows:
+            key = _empty_key(endpoint, parameter_code, state_fips, chunk_b, chunk_e)
+            url = None
+            if not _client.empty_cache.contains(key):
+                url = f"{base}&bdate={chunk_b}&edate={chunk_e}"
+            chunks.append((chunk_b[:4], key, url))
+
+    # Known-empty chunks are answered locally; the rest come back in order
+    fetched = _client.fetch_df_parallel(
+        session, [url for _year, _key, url in chunks if url is not None]
+    )
+    for year_token, key, url in chunks:
+        if url is None:
+            yield year_token, pd.DataFrame()
+            continue
+        _url, df = next(fetched)
+        if df.empty and _client.is_confirmed_empty(df.attrs.get("aqs_status")):
+            _client.empty_cache.put(key)
+        yield year_token, df
 
 
 def fetch_samples_by_state(
@@ -84,42 +164,47 @@ def fetch_samples_by_state(
     API Endpoint:
         https://aqs.epa.gov/data/api/sampleData/byState
     """
-    session = session or _client.make_session()
     months_per_request = max(1, int(getattr(config, "SAMPLE_MONTHS_PER_REQUEST", 1)))
-    for year_b, year_e in _client.build_year_chunks(bdate, edate):
-        for chunk_b, chunk_e in _iter_sample_chunks(
-            year_b, year_e, months_per_request
-        ):
-            params = {
-                "email": config.AQS_EMAIL or "",
-                "key": config.AQS_KEY or "",
-                "param": parameter_code,
-                "bdate": chunk_b,
-                "edate": chunk_e,
-                "state": state_fips,
-            }
-            url = f"https://aqs.epa.gov/data/api/sampleData/byState?{urlencode(params)}"
-            df = _client.fetch_df(session, url)
-            year_token = chunk_b[:4]  # Preserve file naming by year
-            yield year_token, df
+    return _fetch_by_state(
+        "sampleData",
+        parameter_code,
+        bdate,
+        edate,
+        state_fips,
+        session=session,
+        months_per_request=months_per_request,
+    )
 
 
 def fetch_samples_for_parameter(
-    parameter_code: str, bdate: date, edate: date, state_fips: str
-) -> pd.DataFrame:
+    parameter_code: str,
+    bdate: date,
+    edate: date,
+    state_fips: str,
+    session=None,
+    output_path: Path | str | None = None,
+) -> pd.DataFrame | Path | None:
     """Fetch sample data for a parameter and return a single concatenated DataFrame.
 
     Historically callers requested a single DataFrame for a parameter. This helper
     consumes the year-by-year generator and concatenates non-empty yearly frames
     into a single DataFrame, preserving all API fields without modification.
 
+    With ``output_path`` set, chunks are instead streamed to a zstd-compressed
+    parquet file, one row group per chunk, so memory stays bounded by a single
+    chunk. The path is returned, or None if no data was returned.
+
     Returns an empty DataFrame if no data was returned.
     """
-    frames = []
     session = session or _client.make_session()
-    for _year, df in fetch_samples_by_state(
+    chunks = fetch_samples_by_state(
         parameter_code, bdate, edate, state_fips, session=session
-    ):
+    )
+    if output_path is not None:
+        return _stream_samples_to_parquet(chunks, Path(output_path))
+
+    frames = []
+    for _year, df in chunks:
         if df is None:
             continue
         if not df.empty:
@@ -127,10 +212,67 @@ def fetch_samples_for_parameter(
     if not frames:
         # Return an empty DataFrame with no columns
         return pd.DataFrame()
-    # Concatenate and preserve original column order and types
+    if len(frames) == 1:
+        # Single chunk: already range-indexed, skip the concat copy
+        return frames[0]
+    # Concatenate once and preserve original column order and types
     return pd.concat(frames, ignore_index=True)
 
 
+def _stream_samples_to_parquet(chunks, output_path: Path) -> Path | None:
+    """Write non-empty ``(year, df)`` chunks to ``output_path`` as parquet row groups.
+
+    The schema comes from the first chunk. Integer columns are stored as
+    float64, since AQS numbers decode as int or float depending on the values
+    in a chunk, and columns that chunk left all-null are stored as strings;
+    later chunks are aligned and cast to that schema. The file is written
+    under a temporary name and renamed only once every chunk is in, so a
+    failed pull leaves no partial file behind.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    def _stored_type(field):
+        if pa.types.is_null(field.type):
+            return pa.field(field.name, pa.string())
+        if pa.types.is_integer(field.type):
+            return pa.field(field.name, pa.float64())
+        return field
+
+    part_path = output_path.with_name(output_path.name + ".part")
+    writer = None
+    schema = None
+    try:
+        for _year, df in chunks:
+            if df is None or df.empty:
+                continue
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if writer is None:
+                schema = pa.schema(_stored_type(f) for f in table.schema).remove_metadata()
+                _ensure_dir(output_path.parent)
+                writer = pq.ParquetWriter(part_path, schema, compression="zstd")
+            else:
+                # Missing columns become nulls; extra columns are dropped
+                table = pa.table(
+                    [
+                        table[name] if name in table.column_names
+                        else pa.nulls(table.num_rows, schema.field(name).type)
+                        for name in schema.names
+                    ],
+                    names=schema.names,
+                )
+            writer.write_table(table.cast(schema))
+        if writer is not None:
+            writer.close()
+            part_path.replace(output_path)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+            part_path.unlink(missing_ok=True)
+        raise
+    return output_path if writer is not None else None
+
+
 def fetch_annual_by_state(
     parameter_code: str, bdate: date, edate: date, state_fips: str, session=None
 ):
@@ -153,20 +295,9 @@ def fetch_annual_by_state(
     API Endpoint:
         https://aqs.epa.gov/data/api/annualData/byState
     """
-    session = session or _client.make_session()
-    for b, e in _client.build_year_chunks(bdate, edate):
-        params = {
-            "email": config.AQS_EMAIL or "",
-            "key": config.AQS_KEY or "",
-            "param": parameter_code,
-            "bdate": b,
-            "edate": e,
-            "state": state_fips,
-        }
-        url = f"https://aqs.epa.gov/data/api/annualData/byState?{urlencode(params)}"
-        df = _client.fetch_df(session, url)
-        year_token = b[:4]
-        yield year_token, df
+    return _fetch_by_state(
+        "annualData", parameter_code, bdate, edate, state_fips, session=session
+    )
 
 
 def fetch_daily_by_state(
@@ -191,20 +322,9 @@ def fetch_daily_by_state(
     API Endpoint:
         https://aqs.epa.gov/data/api/dailyData/byState
     """
-    session = session or _client.make_session()
-    for b, e in _client.build_year_chunks(bdate, edate):
-        params = {
-            "email": config.AQS_EMAIL or "",
-            "key": config.AQS_KEY or "",
-            "param": parameter_code,
-            "bdate": b,
-            "edate": e,
-            "state": state_fips,
-        }
-        url = f"https://aqs.epa.gov/data/api/dailyData/byState?{urlencode(params)}"
-        df = _client.fetch_df(session, url)
-        year_token = b[:4]
-        yield year_token, df
+    return _fetch_by_state(
+        "dailyData", parameter_code, bdate, edate, state_fips, session=session
+    )
 
 
 def write_annual_for_parameter(
@@ -233,7 +353,7 @@ def write_annual_for_parameter(
 
     Returns:
         Dictionary with extraction results including row counts per year and status.
-        Written to logs/annual_{parameter_code}_{group_store}_{timestamp}.json
+        Recorded in logs/extract_audit_{run_timestamp}.jsonl via AUDIT
 
     Output Files:
         raw/aqs/annual/aqs_annual_{group_store}_{year}.csv
@@ -243,9 +363,7 @@ def write_annual_for_parameter(
 
     # Look up group_store category from dimPollutant.csv if not provided
     if group_store is None:
-        from utils import get_parameter_group
-
-        group_store = get_parameter_group(parameter_code)
+        group_store = _get_parameter_group(parameter_code)
 
     results = {
         "parameter": parameter_code,
@@ -254,36 +372,40 @@ def write_annual_for_parameter(
         "years": {},
         "status": "ok",
     }
-    logs_dir = Path(config.ROOT) / "raw" / "aqs" / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
 
     try:
         # Create output directory (files go directly here, no year subdirectories)
-        config.RAW_AQS_ANNUAL.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(config.RAW_AQS_ANNUAL)
 
-        # Fetch and write data year by year
-        for year_token, df in fetch_annual_by_state(
-            parameter_code, bdate, edate, state_fips, session=session
-        ):
+        # Stream data year by year straight into the per-year CSV
+        base = _by_state_base("annualData", parameter_code, state_fips)
+        for b, e in _client.build_year_chunks(bdate, edate):
+            year_token = b[:4]
             out_path = config.RAW_AQS_ANNUAL / f"aqs_annual_{group_store}_{year_token}.csv"
-            if df is None or df.empty:
+            key = _empty_key("annualData", parameter_code, state_fips, b, e)
+            if _client.empty_cache.contains(key):
                 results["years"][year_token] = {"rows": 0, "path": str(out_path)}
                 continue
-            # Append to existing file or create new with header
+            url = f"{base}&bdate={b}&edate={e}"
+            # Appends to existing file or creates new with header;
             # API response data written without modification
-            append_csv(df, out_path)
-            results["years"][year_token] = {"rows": len(df), "path": str(out_path)}
+            header: dict = {}
+            rows = _client.fetch_rows_to_csv(session, url, out_path, header=header)
+            if rows == 0 and _client.is_confirmed_empty(header.get("status")):
+                _client.empty_cache.put(key)
+            results["years"][year_token] = {"rows": rows, "path": str(out_path)}
+    except _client.QuotaExhaustedError as exc:
+        # Remaining year chunks are skipped; caller can defer and rerun later
+        results["status"] = "quota_exhausted"
+        results["error"] = str(exc)
+        results["retry_after"] = exc.retry_after
     except Exception as exc:
         results["status"] = "failed"
         results["error"] = str(exc)
 
-    # Write audit log with extraction results
-    from loaders.filesystem import atomic_write_json
-
-    ts = __import__("datetime").datetime.utcnow().strftime("%Y-%m-%dT%H-%M-%SZ")
-    audit_name = f"annual_{parameter_code}_{group_store}_{ts}.json"
-    audit_path = logs_dir / audit_name
-    atomic_write_json(audit_path, results)
+    # Record extraction results in the run's audit log
+    ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H-%M-%SZ")
+    AUDIT.log({"audit": "annual", "logged_at": ts, **results})
 
     return results
 
@@ -314,7 +436,7 @@ def write_daily_for_parameter(
 
     Returns:
         Dictionary with extraction results including row counts per year and status.
-        Written to logs/daily_{parameter_code}_{group_store}_{timestamp}.json
+        Recorded in logs/extract_audit_{run_timestamp}.jsonl via AUDIT
 
     Output Files:
         raw/aqs/daily/aqs_daily_{group_store}_{year}.csv
@@ -324,9 +446,7 @@ def write_daily_for_parameter(
 
     # Look up group_store category from dimPollutant.csv if not provided
     if group_store is None:
-        from utils import get_parameter_group
-
-        group_store = get_parameter_group(parameter_code)
+        group_store = _get_parameter_group(parameter_code)
 
     results = {
         "parameter": parameter_code,
@@ -335,32 +455,38 @@ def write_daily_for_parameter(
         "years": {},
         "status": "ok",
     }
-    logs_dir = Path(config.ROOT) / "raw" / "aqs" / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
 
     try:
         # Create output directory (files go directly here, no year subdirectories)
-        config.RAW_AQS_DAILY.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(config.RAW_AQS_DAILY)
 
-        for year_token, df in fetch_daily_by_state(
-            parameter_code, bdate, edate, state_fips, session=session
-        ):
+        # Stream data year by year straight into the per-year CSV
+        base = _by_state_base("dailyData", parameter_code, state_fips)
+        for b, e in _client.build_year_chunks(bdate, edate):
+            year_token = b[:4]
             out_path = config.RAW_AQS_DAILY / f"aqs_daily_{group_store}_{year_token}.csv"
-            if df is None or df.empty:
+            key = _empty_key("dailyData", parameter_code, state_fips, b, e)
+            if _client.empty_cache.contains(key):
                 results["years"][year_token] = {"rows": 0, "path": str(out_path)}
                 continue
-            append_csv(df, out_path)
-            results["years"][year_token] = {"rows": len(df), "path": str(out_path)}
+            url = f"{base}&bdate={b}&edate={e}"
+            header: dict = {}
+            rows = _client.fetch_rows_to_csv(session, url, out_path, header=header)
+            if rows == 0 and _client.is_confirmed_empty(header.get("status")):
+                _client.empty_cache.put(key)
+            results["years"][year_token] = {"rows": rows, "path": str(out_path)}
+    except _client.QuotaExhaustedError as exc:
+        # Remaining year chunks are skipped; caller can defer and rerun later
+        results["status"] = "quota_exhausted"
+        results["error"] = str(exc)
+        results["retry_after"] = exc.retry_after
     except Exception as exc:
         results["status"] = "failed"
         results["error"] = str(exc)
 
-    from loaders.filesystem import atomic_write_json
-
-    ts = __import__("datetime").datetime.utcnow().strftime("%Y-%m-%dT%H-%M-%SZ")
-    audit_name = f"daily_{parameter_code}_{group_store}_{ts}.json"
-    audit_path = logs_dir / audit_name
-    atomic_write_json(audit_path, results)
+    # Record extraction results in the run's audit log
+    ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H-%M-%SZ")
+    AUDIT.log({"audit": "daily", "logged_at": ts, **results})
 
     return results
 
@@ -388,20 +514,9 @@ def fetch_qualifiers_by_state(
     API Endpoint:
         https://aqs.epa.gov/data/api/transactionsSample/byState
     """
-    session = session or _client.make_session()
-    for b, e in _client.build_year_chunks(bdate, edate):
-        params = {
-            "email": config.AQS_EMAIL or "",
-            "key": config.AQS_KEY or "",
-            "param": parameter_code,
-            "bdate": b,
-            "edate": e,
-            "state": state_fips,
-        }
-        url = f"https://aqs.epa.gov/data/api/transactionsSample/byState?{urlencode(params)}"
-        df = _client.fetch_df(session, url)
-        year_token = b[:4]
-        yield year_token, df
+    return _fetch_by_state(
+        "transactionsSample", parameter_code, bdate, edate, state_fips, session=session
+    )
 
 
 def write_qualifiers_for_toxics(
@@ -424,7 +539,7 @@ def write_qualifiers_for_toxics(
 
     Returns:
         Dictionary with extraction results including row counts per year and status.
-        Written to logs/qualifiers_toxics_{timestamp}.json
+        Recorded in logs/extract_audit_{run_timestamp}.jsonl via AUDIT
 
     Output Files:
         raw/aqs/qualifiers/aqs_qualifiers_toxics_{year}.csv
@@ -450,12 +565,10 @@ def write_qualifiers_for_toxics(
         },
         "status": "ok",
     }
-    logs_dir = Path(config.ROOT) / "raw" / "aqs" / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
 
     try:
         # Create output directory
-        config.RAW_AQS_QUALIFIERS.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(config.RAW_AQS_QUALIFIERS)
 
         # Track all data by year
         yearly_data = {}
@@ -497,6 +610,15 @@ def write_qualifiers_for_toxics(
                     results["parameters"]["successful"] += 1  # No data is still successful
                     print(f"   ⚠️  No data found")
                 
+            except _client.QuotaExhaustedError as exc:
+                # Quota resets take longer than we should wait; stop here
+                param_results["status"] = "quota_exhausted"
+                param_results["error"] = str(exc)
+                results["parameters"]["details"][param_code] = param_results
+                results["status"] = "quota_exhausted"
+                results["retry_after"] = exc.retry_after
+                print(f"   🛑 {exc}; skipping remaining parameters")
+                break
             except Exception as exc:
                 param_results["status"] = "failed"
                 param_results["error"] = str(exc)
@@ -508,28 +630,25 @@ def write_qualifiers_for_toxics(
         
         # Write consolidated files per year
         print(f"\n📁 Writing consolidated qualifier files...")
-        for year_token, dfs in yearly_data.items():
-            out_path = config.RAW_AQS_QUALIFIERS / f"aqs_qualifiers_toxics_{year_token}.csv"
-            if not dfs:
-                results["years"][year_token] = {"rows": 0, "path": str(out_path)}
-                continue
-                
-            # Concatenate all parameter data for this year
-            combined_df = pd.concat(dfs, ignore_index=True)
-            append_csv(combined_df, out_path)
-            results["years"][year_token] = {"rows": len(combined_df), "path": str(out_path)}
-            print(f"   📅 {year_token}: {len(combined_df)} records -> {out_path.name}")
+        with CsvAppender() as appender:
+            for year_token, dfs in yearly_data.items():
+                out_path = config.RAW_AQS_QUALIFIERS / f"aqs_qualifiers_toxics_{year_token}.csv"
+                if not dfs:
+                    results["years"][year_token] = {"rows": 0, "path": str(out_path)}
+                    continue
+
+                # Concatenate all parameter data for this year in one pass
+                combined_df = dfs[0] if len(dfs) == 1 else pd.concat(dfs, ignore_index=True)
+                appender.append(combined_df, out_path)
+                results["years"][year_token] = {"rows": len(combined_df), "path": str(out_path)}
+                print(f"   📅 {year_token}: {len(combined_df)} records -> {out_path.name}")
             
     except Exception as exc:
         results["status"] = "failed"
         results["error"] = str(exc)
 
-    # Write audit log with extraction results
-    from loaders.filesystem import atomic_write_json
-
-    ts = __import__("datetime").datetime.utcnow().strftime("%Y-%m-%dT%H-%M-%SZ")
-    audit_name = f"qualifiers_toxics_{ts}.json"
-    audit_path = logs_dir / audit_name
-    atomic_write_json(audit_path, results)
+    # Record extraction results in the run's audit log
+    ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H-%M-%SZ")
+    AUDIT.log({"audit": "qualifiers_toxics", "logged_at": ts, **results})
 
     return results
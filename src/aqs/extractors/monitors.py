@@ -1,29 +1,39 @@
 """Extractors for AQS monitor data.
 
-This module contains the existing metadata extractor (`fetch_monitors`) plus
-additional, sample-first helpers to fetch AQS `sampleData/bySite` results.
+This module fetches AQS `monitors/byState` metadata, either per parameter
+(`fetch_monitors`) or for Oregon reduced to one row per monitoring site
+(`fetch_all_monitors_for_oregon`). Sample, daily and annual measurements live
+in `aqs.extractors.measurements`.
 
 Design notes:
 - The repository prefers lazy registration of AQS credentials via
-  `src/soar/config.set_aqs_credentials()`. Sample/live HTTP helpers below will
-  read `config.AQS_EMAIL` and `config.AQS_KEY` when building API URLs.
-- The sample-data helpers use the same per-year splitting logic as the R
-  reference implementation (one request per calendar year chunk).
+  `src/soar/config.set_aqs_credentials()`. The HTTP helpers below read
+  `config.AQS_EMAIL` and `config.AQS_KEY` when building API URLs.
+- Requests use the same per-year splitting logic as the R reference
+  implementation (one request per calendar year chunk).
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import logging
 from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import List, Optional
-from urllib.parse import urlencode
+from functools import lru_cache, partial
+from typing import List
+from urllib.parse import parse_qs, quote_plus, urlparse
 
 import pandas as pd
 import requests
 
-import config
 from aqs import _client
+from aqs.transformers._site_code import site_code_from_parts
+from logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# One pooled, rate-limited session per process for callers that don't pass
+# their own, so repeated monitor requests reuse keep-alive connections
+_shared_session = lru_cache(maxsize=1)(_client.make_session)
 
 
 def _add_site_code(df: pd.DataFrame) -> pd.DataFrame:
@@ -31,116 +41,125 @@ def _add_site_code(df: pd.DataFrame) -> pd.DataFrame:
 
     Creates site_code as: state_code (2 digits) + county_code (3 digits) + site_number (4 digits)
     For Oregon data, defaults state_code to 41 if missing/invalid.
+    The returned frame shares the other columns' data with ``df``.
     """
-    df = df.copy()
-
-    # Handle NaN and non-numeric values robustly
-    df["state_code_num"] = pd.to_numeric(df["state_code"], errors="coerce")
-    df["county_code_num"] = pd.to_numeric(df["county_code"], errors="coerce")
-    df["site_number_num"] = pd.to_numeric(df["site_number"], errors="coerce")
-
-    # Default to Oregon state code (41) if missing or invalid
-    df["state_code_num"] = df["state_code_num"].fillna(41).astype(int)
-    df["state_code_num"] = df["state_code_num"].where(df["state_code_num"] == 41, 41)
-
-    # Fill missing county/site codes with 0
-    df["county_code_num"] = df["county_code_num"].fillna(0).astype(int)
-    df["site_number_num"] = df["site_number_num"].fillna(0).astype(int)
-
-    df["site_code"] = (
-        df["state_code_num"].astype(str).str.zfill(2)
-        + df["county_code_num"].astype(str).str.zfill(3)
-        + df["site_number_num"].astype(str).str.zfill(4)
-    )
-
-    # Clean up temporary columns
-    df = df.drop(columns=["state_code_num", "county_code_num", "site_number_num"])
-
-    # Move column
-    col = df.pop("site_code")
-    df.insert(3, "site_code", col)
+    # Missing or invalid county/site codes become 0; every row is Oregon (41)
+    site_code = site_code_from_parts(df["county_code"], df["site_number"])
+    # Shallow copy so the new column doesn't alter the caller's frame; assign()
+    # would deep-copy every column first
+    out = df.copy(deep=False)
+    if "site_code" in out.columns:
+        del out["site_code"]
+    out.insert(3, "site_code", site_code)
 
-    return df
+    return out
 
 
-def fetch_aqs_response(api_url: str) -> pd.DataFrame:
+def fetch_aqs_response(
+    api_url: str, session: requests.Session | None = None
+) -> pd.DataFrame:
     """Fetch a raw AQS API URL and return a DataFrame of the data payload.
 
     The AQS JSON responses are structured as a two-element result where the
     second element is the data array (the R script used `[[2]]`). We mirror that
     behavior here.
+
+    Without a ``session`` the module's shared pooled session is used, so
+    keep-alive connections are reused instead of re-handshaking TLS on every
+    call. The request goes through ``_client.fetch_json``, which retries
+    throttling and server errors, honours the circuit breaker and serves
+    past-year responses from the opt-in response cache; errors are raised to
+    the caller.
     """
+    if logger.isEnabledFor(logging.DEBUG):
+        # Never log the URL itself: its query string carries the AQS credentials
+        query = parse_qs(urlparse(api_url).query)
+        logger.debug(
+            "Fetching %s param=%s bdate=%s edate=%s",
+            urlparse(api_url).path,
+            query.get("param", [""])[0],
+            query.get("bdate", [""])[0],
+            query.get("edate", [""])[0],
+        )
+    parsed = _client.fetch_json(session or _shared_session(), api_url)
+
+    # AQS typically returns [header, data]; if data missing return empty frame
     try:
-        print(f"Fetching AQS data from: {api_url}")
-        resp = requests.get(api_url)
-        resp.raise_for_status()
-        parsed = resp.json()
-        # AQS typically returns [header, data]; if data missing return empty frame
-
-        try:
-            # Handle list format: [header, data]
-            if isinstance(parsed, list) and len(parsed) > 1:
-                data = parsed[1]
-            # Handle dict format with 'Data' key (common in EPA APIs)
-            elif isinstance(parsed, dict) and "Data" in parsed:
-                data = parsed["Data"]
-            else:
-                data = []
-        except (KeyError, IndexError, TypeError) as e:
-            print(f"⚠️  Error extracting data from API response: {type(e).__name__}: {e}")
-            print(f"    Response type: {type(parsed)}, Response structure: {list(parsed.keys()) if isinstance(parsed, dict) else f'list of length {len(parsed)}' if isinstance(parsed, list) else 'unknown'}")
-            return pd.DataFrame()
-        
-        if not data:
-            return pd.DataFrame()
-        return pd.DataFrame(data)
-    except requests.exceptions.RequestException as e:
-        print(f"❌ API request failed: {e}")
-        return pd.DataFrame()
-    except ValueError as e:
-        print(f"❌ JSON parsing error: {e}")
+        # Handle list format: [header, data]
+        if isinstance(parsed, list) and len(parsed) > 1:
+            data = parsed[1]
+        # Handle dict format with 'Data' key (common in EPA APIs)
+        elif isinstance(parsed, dict) and "Data" in parsed:
+            data = parsed["Data"]
+        else:
+            data = []
+    except (KeyError, IndexError, TypeError) as e:
+        logger.warning(
+            "Error extracting data from API response: %s: %s (response type: %s)",
+            type(e).__name__,
+            e,
+            type(parsed).__name__,
+        )
         return pd.DataFrame()
 
+    return _client.records_to_frame(data)
+
 
 def build_aqs_requests(
     parameter_code_list: list[str],
     start_date: date | str,
     end_date: date | str,
+    state: str = "41",
 ) -> List[str]:
     """Return a list of AQS monitor request URLs split by calendar year.
 
     start_date and end_date may be datetime.date or ISO strings. Returned
     URLs include the configured `config.AQS_EMAIL` and `config.AQS_KEY`.
+    `state` is the 2-digit state FIPS code (Oregon by default).
     """
-    # Normalize dates
-    sdate = pd.to_datetime(start_date).date()
-    edate = pd.to_datetime(end_date).date()
-    years = range(sdate.year, edate.year + 1)
-
-    urls: List[str] = []
-    for parameter_code in parameter_code_list:
-        for i, y in enumerate(years):
-            if i == 0:
-                b = sdate.strftime("%Y%m%d")
-            else:
-                b = f"{y}0101"
-            if i == len(years) - 1:
-                e = edate.strftime("%Y%m%d")
-            else:
-                e = f"{y}1231"
-
-            params = {
-                "email": config.AQS_EMAIL or "",
-                "key": config.AQS_KEY or "",
-                "param": parameter_code,
-                "bdate": b,
-                "edate": e,
-                "state": "41"
-            }
-            url = f"https://aqs.epa.gov/data/api/monitors/byState?{urlencode(params)}"
-            urls.append(url)
-
-    return urls
+    # Year chunks are memoized by the shared client, so every parameter reuses them
+    chunks = _client.build_year_chunks(start_date, end_date)
+
+    # Encode the fixed query fields once; date chunks are plain YYYYMMDD digits
+    creds = _client.credentials_query()
+    prefixes = [
+        f"https://aqs.epa.gov/data/api/monitors/byState?{creds}&param={quote_plus(str(code))}"
+        for code in parameter_code_list
+    ]
+    return [
+        f"{prefix}&bdate={b}&edate={e}&state={state}" for prefix in prefixes for b, e in chunks
+    ]
+
+
+def fetch_monitors(
+    parameter_codes: list[str],
+    bdate: date | str,
+    edate: date | str,
+    state: str,
+    session: requests.Session | None = None,
+) -> pd.DataFrame:
+    """Fetch `monitors/byState` metadata for each parameter code.
+
+    Rows keep every API field and are tagged with the `seed_parameter_code`
+    they were requested for. Year chunks are fetched concurrently over one
+    pooled session; errors are raised to the caller.
+
+    Returns an empty DataFrame if no monitors were returned.
+    """
+    session = session or _shared_session()
+    frames: List[pd.DataFrame] = []
+    for code in parameter_codes:
+        urls = build_aqs_requests([code], bdate, edate, state=state)
+        for _url, df in _client.fetch_df_parallel(session, urls):
+            if not df.empty:
+                # Frames come fresh from the client, so tag them in place
+                df["seed_parameter_code"] = code
+                frames.append(df)
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True)
 
 
 def fetch_all_monitors_for_oregon(bdate: date, edate: date) -> pd.DataFrame:
@@ -181,29 +200,32 @@ def fetch_all_monitors_for_oregon(bdate: date, edate: date) -> pd.DataFrame:
 
     # Fetch monitors for each parameter across the full date range (more efficient)
     all_monitors: List[pd.DataFrame] = []
-
-    # Use ThreadPoolExecutor for concurrent fetching
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        futures = [executor.submit(fetch_aqs_response, url) for url in urls]
-        for future in futures:
-            df = future.result()
+    seen_sites: set[str] = set()
+    original_count = 0
+
+    # Overlap requests up to the shared AQS in-flight cap (AQS_MAX_INFLIGHT);
+    # all workers share one pooled, rate-limited session
+    session = _shared_session()
+    workers = min(len(urls), _client._INFLIGHT_LIMIT) or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for df in executor.map(partial(fetch_aqs_response, session=session), urls):
+            if df.empty:
+                continue
+            original_count += len(df)
+            # Deduplicate by site_code as frames arrive, keeping the first row per
+            # monitor location, so the final concat copies only unique sites
+            df = _add_site_code(df)
+            df = df[~df["site_code"].duplicated() & ~df["site_code"].isin(seen_sites)]
             if not df.empty:
+                seen_sites.update(df["site_code"])
                 all_monitors.append(df)
 
-    # Concatenate and deduplicate by site_code (one entry per monitor location)
     if not all_monitors:
         print("❌ No monitors found for any parameter")
         return pd.DataFrame()
 
-    print("🔄 Concatenating and deduplicating monitor data...")
+    print("🔄 Concatenating deduplicated monitor data...")
     combined = pd.concat(all_monitors, ignore_index=True)
-    original_count = len(combined)
-
-    # Create site_code efficiently
-    combined = _add_site_code(combined)
-
-    # Deduplicate by site_code (one entry per monitor location)
-    combined = combined.drop_duplicates(subset=["site_code"])
     deduped_count = len(combined)
 
     print(
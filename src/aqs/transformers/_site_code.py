@@ -0,0 +1,42 @@
+"""Build AQS site codes (SSCCCNNNN) from their state, county and site parts."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def _int_part(values, default: int) -> np.ndarray:
+    """Coerce a code column to int64, with missing or non-numeric codes as ``default``."""
+    numbers = pd.to_numeric(pd.Series(values), errors="coerce").fillna(default)
+    return numbers.to_numpy(dtype=np.int64)
+
+
+def site_code_from_parts(county, site, state=41) -> np.ndarray:
+    """Return site codes as state (2) + county (3) + site number (4) digit strings.
+
+    Missing or non-numeric county and site numbers become 0, and a missing
+    state becomes Oregon (41). ``state`` may be a column or a single code.
+    The parts are packed into one SSCCCNNNN integer and formatted once,
+    instead of zero-padding each part in its own string pass. Parts too wide
+    for their field would carry into the next one, so those fall back to
+    padding and joining each part as text.
+    """
+    state = state if np.isscalar(state) else _int_part(state, 41)
+    county = _int_part(county, 0)
+    site = _int_part(site, 0)
+    if (np.asarray(state) > 99).any() or (county > 999).any() or (site > 9999).any():
+        text = np.char.add(
+            np.char.add(
+                np.char.zfill(np.broadcast_to(state, site.shape).astype(str), 2),
+                np.char.zfill(county.astype(str), 3),
+            ),
+            np.char.zfill(site.astype(str), 4),
+        )
+        return text.astype(object)
+    codes = state * 10_000_000 + county * 10_000 + site
+    text = codes.astype(str)
+    if (codes < 100_000_000).any():
+        # Single-digit state codes need their leading zero back
+        text = np.char.zfill(text, 9)
+    return text.astype(object)
@@ -0,0 +1,64 @@
+"""dimPollutant lookups and exceedance arithmetic shared by the TRV transformers."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Reference columns taken from dimPollutant for each toxics parameter
+TRV_COLUMNS = ["mol_weight_g_mol", "carbon_atoms", "trv_cancer", "trv_noncancer", "trv_acute"]
+
+
+@lru_cache(maxsize=8)
+def load_dim_trv(path: str, mtime: float) -> pd.DataFrame:
+    """Read the toxics TRV reference columns from dimPollutant, indexed by aqs_parameter.
+
+    ``mtime`` is part of the cache key so an updated file is re-read. Callers
+    must not mutate the returned frame.
+    """
+    dim_pollutant = pd.read_csv(
+        path,
+        usecols=["aqs_parameter", "group_store", *TRV_COLUMNS],
+        dtype={"aqs_parameter": str, "group_store": "category"},
+    )
+    dim_trv = dim_pollutant[dim_pollutant["group_store"] == "toxics"]
+    return dim_trv.set_index("aqs_parameter")[TRV_COLUMNS]
+
+
+def merge_trv(df: pd.DataFrame, dim_trv: pd.DataFrame) -> pd.DataFrame:
+    """Left-join the ``dim_trv`` reference columns onto ``df`` by parameter_code.
+
+    parameter_code is factorized to integer codes, so each distinct code is
+    looked up once and the columns are gathered by position; ``df`` gets new
+    columns in place instead of being copied by a merge.
+    """
+    if not dim_trv.index.is_unique:
+        return df.merge(dim_trv, left_on="parameter_code", right_index=True, how="left")
+    if dim_trv.empty:
+        # No toxics reference rows: every lookup misses, as in a left merge
+        for column in dim_trv.columns:
+            df[column] = np.nan
+        return df
+    codes, uniques = pd.factorize(df["parameter_code"])
+    rows = dim_trv.index.get_indexer(uniques)[codes]
+    found = rows >= 0
+    values = dim_trv.to_numpy()
+    for i, column in enumerate(dim_trv.columns):
+        df[column] = np.where(found, values[rows, i], np.nan)
+    return df
+
+
+def safe_div(n, d):
+    """Divide with NaN/zero protection (vectorized for pandas Series).
+
+    NaN operands already give NaN under IEEE division, so only zero divisors
+    need masking.
+    """
+    n = np.asarray(n, dtype=float)
+    d = np.asarray(d, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = n / d
+    result[d == 0] = np.nan
+    return result
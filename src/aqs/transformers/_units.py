@@ -0,0 +1,120 @@
+"""Unit normalization and µg/m³ conversion shared by the TRV transformers."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+# Unit normalization aliases, keyed by the lowercased unit with spaces (and,
+# for sample data, commas) removed. Read-only: the table is shared by every
+# caller of normalize_units
+UNIT_ALIASES: Mapping[str, str] = MappingProxyType({
+    "micrograms/cubicmeter": "ug/m3",
+    "microgrampercubmeter": "ug/m3",
+    "microgramsperm3": "ug/m3",
+    "ug/m3": "ug/m3",
+    "µg/m3": "ug/m3",
+    "ug/m^3": "ug/m3",
+    "ug/m³": "ug/m3",
+    "µg/m³": "ug/m3",
+    "nanograms/cubicmeter": "ng/m3",
+    "nanogramscubicmeter(25c)": "ng/m3",
+    "nanograms/cubicmeter(25c)": "ng/m3",
+    "nanogramscubicmeter(lc)": "ng/m3",
+    "nanograms/cubicmeter(lc)": "ng/m3",
+    "nanogramsperm3": "ng/m3",
+    "ng/m3": "ng/m3",
+    "milligrams/cubicmeter": "mg/m3",
+    "mg/m3": "mg/m3",
+    "ppb": "ppb",
+    "ppbv": "ppb",
+    "partsperbillion": "ppb",
+    "partsperbillioncarbon": "ppbc",
+    "partsperbillionvolume": "ppb",
+    "ppm": "ppm",
+    "ppmv": "ppm",
+    "partspermillion": "ppm",
+    "partspermillionvolume": "ppm",
+})
+
+# Normalized units in a fixed order; "" (unknown) is code 0
+_UNIT_CATEGORIES = ["", "ug/m3", "ng/m3", "mg/m3", "ppb", "ppbc", "ppm"]
+_UNIT_INDEX = pd.Index(_UNIT_CATEGORIES)
+
+# Characters dropped from a lowercased unit before the alias lookup, compiled
+# once instead of on every call
+_STRIP_SPACES_RE = re.compile(" ")
+_STRIP_SPACES_COMMAS_RE = re.compile("[ ,]")
+
+
+def normalize_units(units: pd.Series, strip_commas: bool = True) -> pd.Series:
+    """Normalize unit strings to standard form; missing or unknown units become "".
+
+    Only the distinct raw strings are normalized. The result is a categorical
+    over ``_UNIT_CATEGORIES`` gathered from the factorized integer codes.
+
+    Args:
+        units: Raw units_of_measure column.
+        strip_commas: Also drop commas before the alias lookup, so that
+            "Parts per billion, Carbon" maps to ppbc.
+    """
+    pattern = _STRIP_SPACES_COMMAS_RE if strip_commas else _STRIP_SPACES_RE
+    codes, raw = pd.factorize(units)
+    key = pd.Series(raw).astype("string").str.lower().str.replace(pattern, "", regex=True)
+    ids = _UNIT_INDEX.get_indexer(key.map(UNIT_ALIASES).fillna(""))
+    # Missing raw units (code -1) read the appended 0, the "" category
+    ids = np.append(ids, 0)[codes]
+    return pd.Series(
+        pd.Categorical.from_codes(ids, categories=_UNIT_INDEX), index=units.index
+    )
+
+
+def ug_m3_factors(unit_norm, mol_weight, carbon_atoms):
+    """Per-row (scale, numerator, denominator) that convert values to µg/m³.
+
+    Uses 24.45 L/mol at 25°C, 1 atm for gases. A value converts as
+    ``value * scale * numerator / denominator``, which repeats each unit's
+    formula operation for operation; unknown units give NaN. Computing the
+    factors once lets several value columns share them.
+    """
+    # Integer unit codes (-1 for anything outside _UNIT_CATEGORIES); free when
+    # unit_norm already comes from normalize_units
+    unit = pd.Categorical(unit_norm, categories=_UNIT_INDEX).codes
+    mw = np.asarray(mol_weight, dtype=float)
+    carbon = np.asarray(carbon_atoms, dtype=float)
+
+    conditions = [
+        (unit == 0) | (unit == 1),  # "" or ug/m3
+        unit == 2,  # ng/m3
+        unit == 3,  # mg/m3
+        unit == 4,  # ppb: µg/m³ = ppb × MW / 24.45
+        unit == 5,  # ppbC: µg/m³ = (ppbC × MW) / (carbon_atoms × 24.45)
+        unit == 6,  # ppm: 1 ppm = 1000 ppb
+    ]
+    scale = np.select(conditions, [1.0, 1.0, 1000.0, 1.0, 1.0, 1000.0], default=np.nan)
+    numerator = np.select(
+        # ppbC needs a positive carbon count
+        conditions, [1.0, 1.0, 1.0, mw, np.where(carbon > 0, mw, np.nan), mw], default=np.nan
+    )
+    denominator = np.select(
+        conditions, [1.0, 1000.0, 1.0, 24.45, carbon * 24.45, 24.45], default=np.nan
+    )
+    return scale, numerator, denominator
+
+
+def convert_to_ug_m3(value, factors) -> np.ndarray:
+    """Convert values to µg/m³ with factors from ``ug_m3_factors``.
+
+    ``value`` is either one column or an (n, k) array of k columns that share
+    the same rows; the per-row factors are broadcast across the columns, so
+    several columns convert in one pass.
+    """
+    value = np.asarray(value, dtype=float)
+    scale, numerator, denominator = factors
+    if value.ndim == 2:
+        scale, numerator, denominator = scale[:, None], numerator[:, None], denominator[:, None]
+    return (value * scale * numerator) / denominator
@@ -6,11 +6,68 @@ into cleaned, deduplicated records with standardized fields.
 
 from __future__ import annotations
 
+import csv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
 import pandas as pd
 
+from aqs.transformers._site_code import site_code_from_parts
+
+# Fields kept in the transformed output (in the order requested)
+_DAILY_FIELDS = [
+    "parameter_code",
+    "poc",
+    "parameter",
+    "sample_duration_code",
+    "sample_duration",
+    "date_local",
+    "units_of_measure",
+    "event_type",
+    "observation_count",
+    "observation_percent",
+    "validity_indicator",
+    "arithmetic_mean",
+    "first_max_value",
+    "first_max_hour",
+    "aqi",
+    "method_code",
+    "method",
+    "site_code",
+]
+
+# Raw columns worth parsing: the output fields plus the site_code inputs
+_DAILY_COLUMNS = frozenset(_DAILY_FIELDS) | {"county_code", "site_number"}
+
+
+def _read_daily_csv(file_path: Path) -> pd.DataFrame:
+    """Read the needed columns of one raw daily CSV with pyarrow's parser.
+
+    Only columns used by the transform are parsed; the rest (coordinates, site
+    names, change dates) are skipped. date_local is kept as text (pyarrow
+    would otherwise infer dates), matching the default parser. If pyarrow
+    rejects a file, for example a column whose type changes after the first
+    block, it is re-read with the default parser.
+    """
+    with open(file_path, newline="", encoding="utf-8") as fh:
+        header = next(csv.reader(fh), [])
+    usecols = [column for column in header if column in _DAILY_COLUMNS]
+    try:
+        return pd.read_csv(
+            file_path, engine="pyarrow", usecols=usecols, dtype={"date_local": str}
+        )
+    except (ValueError, TypeError):
+        return pd.read_csv(file_path, usecols=usecols)
+
+
+def _safe_read_daily_csv(file_path: Path) -> pd.DataFrame | None:
+    try:
+        return _read_daily_csv(file_path)
+    except Exception as e:
+        print(f"Warning: Failed to read {file_path}: {e}")
+        return None
+
 
 def transform_aqi_daily(raw_daily_files: List[Path]) -> pd.DataFrame:
     """Transform raw AQI daily data into cleaned records.
@@ -28,16 +85,13 @@ def transform_aqi_daily(raw_daily_files: List[Path]) -> pd.DataFrame:
     if not raw_daily_files:
         return pd.DataFrame()
 
-    # Read and concatenate all files
-    frames = []
-    for file_path in raw_daily_files:
-        try:
-            df = pd.read_csv(file_path)
-            if not df.empty:
-                frames.append(df)
-        except Exception as e:
-            print(f"Warning: Failed to read {file_path}: {e}")
-            continue
+    # Read all files concurrently (parsers release the GIL); map keeps file order
+    with ThreadPoolExecutor(max_workers=min(8, len(raw_daily_files))) as executor:
+        frames = [
+            df
+            for df in executor.map(_safe_read_daily_csv, raw_daily_files)
+            if df is not None and not df.empty
+        ]
 
     if not frames:
         return pd.DataFrame()
@@ -49,72 +103,27 @@ def transform_aqi_daily(raw_daily_files: List[Path]) -> pd.DataFrame:
         return pd.DataFrame()
 
     # Create site_code: state_code (2 digits) + county_code (3 digits) + site_number (4 digits)
-    # For Oregon data, default state_code to 41 if missing/invalid
-    # Handle NaN and non-numeric values robustly
-    combined["state_code_num"] = pd.to_numeric(combined["state_code"], errors="coerce")
-    combined["county_code_num"] = pd.to_numeric(
-        combined["county_code"], errors="coerce"
-    )
-    combined["site_number_num"] = pd.to_numeric(
-        combined["site_number"], errors="coerce"
-    )
-
-    # Default to Oregon state code (41) if missing or invalid
-    combined["state_code_num"] = combined["state_code_num"].fillna(41).astype(int)
-    combined["state_code_num"] = combined["state_code_num"].where(
-        combined["state_code_num"] == 41, 41
+    # Every row is Oregon (41)
+    combined["site_code"] = site_code_from_parts(
+        combined["county_code"], combined["site_number"]
     )
 
-    # Fill missing county/site codes with 0
-    combined["county_code_num"] = combined["county_code_num"].fillna(0).astype(int)
-    combined["site_number_num"] = combined["site_number_num"].fillna(0).astype(int)
-
-    combined["site_code"] = (
-        combined["state_code_num"].astype(str).str.zfill(2)
-        + combined["county_code_num"].astype(str).str.zfill(3)
-        + combined["site_number_num"].astype(str).str.zfill(4)
-    )
-
-    # Clean up temporary columns
-    combined = combined.drop(
-        columns=["state_code_num", "county_code_num", "site_number_num"]
-    )
-
-    # Define the fields to keep (in the order requested)
-    fields_to_keep = [
-        "parameter_code",
-        "poc",
-        "parameter",
-        "sample_duration_code",
-        "sample_duration",
-        "date_local",
-        "units_of_measure",
-        "event_type",
-        "observation_count",
-        "observation_percent",
-        "validity_indicator",
-        "arithmetic_mean",
-        "first_max_value",
-        "first_max_hour",
-        "aqi",
-        "method_code",
-        "method",
-        "site_code",
-    ]
-
     # Filter to only the fields that exist in the data
-    available_fields = [field for field in fields_to_keep if field in combined.columns]
+    columns = frozenset(combined.columns)
+    available_fields = [field for field in _DAILY_FIELDS if field in columns]
     if not available_fields:
         raise ValueError(
             "None of the requested fields are present in the raw daily data"
         )
 
-    # Select the available fields
-    transformed = combined[available_fields].copy()
-
-    # Filter out records with empty AQI values
-    transformed = transformed.dropna(subset=["aqi"])
-    transformed = transformed[transformed["aqi"] != ""]
+    # Filter out records with empty AQI values and select the available fields
+    # in one indexing step, so only the kept rows and columns are copied
+    aqi = combined["aqi"]
+    has_aqi = aqi.notna()
+    if not pd.api.types.is_numeric_dtype(aqi):
+        # Empty strings can only occur when the column was read as text
+        has_aqi &= aqi != ""
+    transformed = combined.loc[has_aqi, available_fields]
 
     # Remove exact duplicate records after field selection
     original_count = len(transformed)
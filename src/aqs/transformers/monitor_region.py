@@ -5,16 +5,42 @@ by performing a spatial join with a regions shapefile.
 """
 
 from __future__ import annotations
+from functools import lru_cache
 from pathlib import Path
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
+from shapely import STRtree
 
 import config
 
 # Default CRS for all geospatial operations (WGS 84)
 DEFAULT_CRS = "EPSG:4326"
 
+
+@lru_cache(maxsize=4)
+def _load_regions(path: str, mtime: float) -> tuple[np.ndarray, np.ndarray]:
+    """Read the regions shapefile in DEFAULT_CRS as (prepared geometries, Region names).
+
+    ``mtime`` is part of the cache key so an updated shapefile is re-read.
+    """
+    print(f"Reading regions from {path}")
+    gdf_regions = gpd.read_file(path)
+
+    if gdf_regions.crs is None:
+        gdf_regions.set_crs(DEFAULT_CRS, inplace=True)
+        print(f"Set regions CRS to {DEFAULT_CRS}")
+    elif gdf_regions.crs != DEFAULT_CRS:
+        print(f"Reprojecting regions from {gdf_regions.crs} to {DEFAULT_CRS}")
+        gdf_regions = gdf_regions.to_crs(DEFAULT_CRS)
+
+    region_geoms = np.asarray(gdf_regions.geometry.values, dtype=object)
+    shapely.prepare(region_geoms)
+    return region_geoms, gdf_regions["Region"].to_numpy(dtype=object)
+
+
 def add_monitor_regions(root_path: Path, raw_monitors: pd.DataFrame) -> pd.DataFrame:
     """
     Enrich monitor data with region information via spatial join.
@@ -53,40 +79,42 @@ def add_monitor_regions(root_path: Path, raw_monitors: pd.DataFrame) -> pd.DataF
     if missing_cols:
         raise ValueError(f"Missing required columns: {missing_cols}")
 
-    # Create GeoDataFrame from monitor coordinates
-
-    gdf_monitors = gpd.GeoDataFrame(
-        raw_monitors,
-        geometry=gpd.points_from_xy(raw_monitors.longitude, raw_monitors.latitude),
-        crs=DEFAULT_CRS,  # WGS 84
-    )
-
-    # Read regions shapefile
-    print(f"Reading regions from {regions_shp_path}")
-    gdf_regions = gpd.read_file(regions_shp_path)
- 
-   
-    if gdf_regions.crs is None:
-        gdf_regions.set_crs(DEFAULT_CRS, inplace=True)
-        print(f"Set regions CRS to {DEFAULT_CRS}")
-    elif gdf_regions.crs != DEFAULT_CRS:
-        print(f"Reprojecting regions from {gdf_regions.crs} to {DEFAULT_CRS}")
-        gdf_regions = gdf_regions.to_crs(DEFAULT_CRS)
-
-    # Perform spatial join
-    print("Performing spatial join")
-    result = gpd.sjoin(
-        gdf_monitors,
-        gdf_regions[["geometry", "Region"]],  # Only keep needed columns
-        how="left",
-        predicate="within",
+    # Monitor coordinates as plain shapely points; no GeoDataFrame is needed
+    points = shapely.points(
+        raw_monitors["longitude"].to_numpy(dtype=float),
+        raw_monitors["latitude"].to_numpy(dtype=float),
     )
 
-    # Clean up the result
-    result = (
-        result
-        .drop(columns=["geometry", "index_right"], errors="ignore")  # Remove spatial columns
-        .fillna({"Region": "Unknown"})  # Fill missing regions
+    # Regions are loaded once per shapefile version (path + mtime)
+    region_geoms, region_names = _load_regions(
+        str(regions_shp_path), regions_shp_path.stat().st_mtime
     )
 
-    return result
\ No newline at end of file
+    # Perform spatial join: index the points and test each prepared region
+    # polygon once ("point within region" == "region contains point")
+    print("Performing spatial join")
+    region_idx, point_idx = STRtree(points).query(region_geoms, predicate="contains")
+
+    # Left-join semantics of sjoin: every monitor is kept once per matching
+    # region (in region order), or once with no region
+    order = np.lexsort((region_idx, point_idx))
+    point_idx, region_idx = point_idx[order], region_idx[order]
+    matches = np.bincount(point_idx, minlength=len(points))
+    rows_per_point = np.maximum(matches, 1)
+    first_row = np.cumsum(rows_per_point) - rows_per_point
+    first_match = np.cumsum(matches) - matches
+    out_rows = first_row[point_idx] + np.arange(len(point_idx)) - first_match[point_idx]
+
+    regions = np.full(int(rows_per_point.sum()), None, dtype=object)
+    regions[out_rows] = region_names[region_idx]
+    regions[pd.isna(regions)] = "Unknown"  # Fill missing regions
+
+    # Copy the monitor rows once; they only need repeating when a point falls
+    # in more than one region
+    if len(regions) == len(points):
+        result = raw_monitors.copy()
+    else:
+        result = raw_monitors.take(np.repeat(np.arange(len(points)), rows_per_point))
+    result["Region"] = regions
+
+    return result
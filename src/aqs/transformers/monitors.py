@@ -65,26 +65,26 @@ def transform_monitors(raw_monitors: pd.DataFrame) -> pd.DataFrame:
     ]
 
     # Filter to only the fields that exist in the data
-    available_fields = [
-        field for field in fields_to_keep if field in raw_monitors.columns
-    ]
+    columns = frozenset(raw_monitors.columns)
+    available_fields = [field for field in fields_to_keep if field in columns]
     if not available_fields:
         raise ValueError(
             "None of the requested fields are present in the raw monitors data"
         )
 
-    # Select the available fields
-    transformed = raw_monitors[available_fields].copy()
-
-    # Deduplicate by site_code, keeping the first occurrence
-    if "site_code" in transformed.columns:
-        original_count = len(transformed)
-        transformed = transformed.drop_duplicates(subset=["site_code"])
+    # Deduplicate by site_code, keeping the first occurrence. Rows are masked on
+    # the single key column before selecting fields, so only unique sites are copied.
+    if "site_code" in raw_monitors.columns:
+        original_count = len(raw_monitors)
+        keep = ~raw_monitors["site_code"].duplicated()
+        transformed = raw_monitors.loc[keep, available_fields]
         deduped_count = len(transformed)
         print(
             f"✅ Deduplicated monitors: {original_count} → {deduped_count} unique sites"
         )
     else:
+        # Column selection already returns a new frame
+        transformed = raw_monitors[available_fields]
         print("⚠️  site_code field not found, skipping deduplication")
 
     return transformed
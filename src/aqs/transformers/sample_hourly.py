@@ -9,8 +9,11 @@ from __future__ import annotations
 from pathlib import Path
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 
+from aqs.transformers._site_code import site_code_from_parts
+
 # Columns to carry through to the staged hourly schema
 _OUTPUT_COLUMNS = [
     "site_code",
@@ -75,29 +78,13 @@ def transform_aqs_sample_hourly(
         return pd.DataFrame()
 
     # Build site_code: zero-padded state(2) + county(3) + site_number(4)
-    # Default state to Oregon (41) if missing or non-numeric
-    combined["_state"] = (
-        pd.to_numeric(combined.get("state_code", pd.Series(dtype="float")), errors="coerce")
-        .fillna(41)
-        .astype(int)
-    )
-    combined["_county"] = (
-        pd.to_numeric(combined.get("county_code", pd.Series(dtype="float")), errors="coerce")
-        .fillna(0)
-        .astype(int)
-    )
-    combined["_site"] = (
-        pd.to_numeric(combined.get("site_number", pd.Series(dtype="float")), errors="coerce")
-        .fillna(0)
-        .astype(int)
-    )
-
-    combined["site_code"] = (
-        combined["_state"].astype(str).str.zfill(2)
-        + combined["_county"].astype(str).str.zfill(3)
-        + combined["_site"].astype(str).str.zfill(4)
+    # Default state to Oregon (41) if missing or non-numeric; county/site to 0.
+    missing = pd.Series(np.nan, index=combined.index)
+    combined["site_code"] = site_code_from_parts(
+        combined.get("county_code", missing),
+        combined.get("site_number", missing),
+        state=combined.get("state_code", missing),
     )
-    combined = combined.drop(columns=["_state", "_county", "_site"])
 
     # Optional parameter filter
     if parameter_codes is not None:
@@ -7,82 +7,19 @@ and return transformed DataFrames without side effects.
 
 from __future__ import annotations
 
-import math
-from typing import Dict
+import os
 
+import numpy as np
 import pandas as pd
 
-# Unit normalization aliases (same as sample)
-UNIT_ALIASES: Dict[str, str] = {
-    "micrograms/cubicmeter": "ug/m3",
-    "microgrampercubmeter": "ug/m3",
-    "microgramsperm3": "ug/m3",
-    "ug/m3": "ug/m3",
-    "µg/m3": "ug/m3",
-    "ug/m^3": "ug/m3",
-    "ug/m³": "ug/m3",
-    "µg/m³": "ug/m3",
-    "nanograms/cubicmeter": "ng/m3",
-    "nanogramscubicmeter(25c)": "ng/m3",
-    "nanograms/cubicmeter(25c)": "ng/m3",
-    "nanogramscubicmeter(lc)": "ng/m3",
-    "nanograms/cubicmeter(lc)": "ng/m3",
-    "nanogramsperm3": "ng/m3",
-    "ng/m3": "ng/m3",
-    "milligrams/cubicmeter": "mg/m3",
-    "mg/m3": "mg/m3",
-    "ppb": "ppb",
-    "ppbv": "ppb",
-    "partsperbillion": "ppb",
-    "partsperbillioncarbon": "ppbc",
-    "partsperbillionvolume": "ppb",
-    "ppm": "ppm",
-    "ppmv": "ppm",
-    "partspermillion": "ppm",
-    "partspermillionvolume": "ppm",
-}
-
-
-def _normalize_unit(unit: str) -> str:
-    """Normalize unit string to standard form."""
-    if pd.isna(unit):
-        return ""
-    return UNIT_ALIASES.get(unit.lower().replace(" ", ""), "")
-
-
-def _convert_to_ug_m3(
-    value: float, unit_norm: str, mol_weight: float, carbon_atoms: float = None
-) -> float:
-    """Convert measurement to µg/m³. Uses 24.45 L/mol at 25°C, 1 atm for gases."""
-    """Convert measurement to µg/m³. Uses 24.45 L/mol at 25°C, 1 atm for gases."""
-    if pd.isna(value):
-        return math.nan
-    v = float(value)
-    if unit_norm in ("ug/m3", ""):
-        return v
-    if unit_norm == "ng/m3":
-        return v / 1000.0
-    if unit_norm == "mg/m3":
-        return v * 1000.0
-    if unit_norm == "ppb":
-        # µg/m³ = ppb × MW / 24.45
-        return (v * mol_weight) / 24.45 if pd.notna(mol_weight) else math.nan
-    if unit_norm == "ppbc":
-        # µg/m³ = (ppbC × MW) / (carbon_atoms × 24.45)
-        if pd.notna(mol_weight) and pd.notna(carbon_atoms) and carbon_atoms > 0:
-            return (v * mol_weight) / (carbon_atoms * 24.45)
-        return math.nan
-    if unit_norm == "ppm":
-        # 1 ppm = 1000 ppb
-        return (v * 1000.0 * mol_weight) / 24.45 if pd.notna(mol_weight) else math.nan
-    return math.nan
-
-
-def _safe_div(n, d):
-    """Divide with NaN/zero protection (vectorized for pandas Series)."""
-    import numpy as np
-
-    return np.where(pd.notna(n) & pd.notna(d) & (d != 0), n / d, np.nan)
+from aqs.transformers._site_code import site_code_from_parts
+from aqs.transformers._trv import load_dim_trv, merge_trv, safe_div
+from aqs.transformers._units import (
+    UNIT_ALIASES,  # noqa: F401  (re-exported for existing importers)
+    convert_to_ug_m3,
+    normalize_units,
+    ug_m3_factors,
+)
 
 
 def transform_toxics_annual_trv(
@@ -97,92 +34,43 @@ def transform_toxics_annual_trv(
     Returns:
         Transformed DataFrame with TRV and exceedance fields.
     """
-    # Load dimPollutant and filter for toxics only
-    dim_pollutant = pd.read_csv(dim_pollutant_path, dtype={"aqs_parameter": str})
-    dim_trv = dim_pollutant[dim_pollutant["group_store"] == "toxics"]
-    dim_trv = dim_trv.set_index("aqs_parameter")[
-        ["mol_weight_g_mol", "carbon_atoms", "trv_cancer", "trv_noncancer", "trv_acute"]
-    ]
+    # Load dimPollutant and filter for toxics only (parsed once per file version)
+    dim_trv = load_dim_trv(
+        str(dim_pollutant_path), os.path.getmtime(dim_pollutant_path)
+    )
 
-    # Normalize units
-    df = df.copy()
+    # Normalize units. A shallow copy is enough: columns are only replaced or
+    # added below, never written in place, so the caller's frame is untouched
+    df = df.copy(deep=False)
     df["parameter_code"] = df["parameter_code"].astype(str)
-    df["units_of_measure_norm"] = df["units_of_measure"].apply(_normalize_unit)
+    df["units_of_measure_norm"] = normalize_units(
+        df["units_of_measure"], strip_commas=False
+    )
 
     # Merge mol_weight and TRV values
-    df = df.merge(
-        dim_trv[
-            [
-                "mol_weight_g_mol",
-                "carbon_atoms",
-                "trv_cancer",
-                "trv_noncancer",
-                "trv_acute",
-            ]
-        ],
-        left_on="parameter_code",
-        right_index=True,
-        how="left",
-    )
+    df = merge_trv(df, dim_trv)
 
     # Convert to ug/m3 using mol_weight
-    df["arithmetic_mean_ug_m3"] = df.apply(
-        lambda r: _convert_to_ug_m3(
-            r["arithmetic_mean"],
-            r["units_of_measure_norm"],
-            r["mol_weight_g_mol"],
-            r["carbon_atoms"],
-        ),
-        axis=1,
+    factors = ug_m3_factors(
+        df["units_of_measure_norm"], df["mol_weight_g_mol"], df["carbon_atoms"]
     )
-    df["first_max_value_ug_m3"] = df.apply(
-        lambda r: _convert_to_ug_m3(
-            r["first_max_value"],
-            r["units_of_measure_norm"],
-            r["mol_weight_g_mol"],
-            r["carbon_atoms"],
-        ),
-        axis=1,
-    )
-    df["second_max_value_ug_m3"] = df.apply(
-        lambda r: _convert_to_ug_m3(
-            r["second_max_value"],
-            r["units_of_measure_norm"],
-            r["mol_weight_g_mol"],
-            r["carbon_atoms"],
-        ),
-        axis=1,
+    value_columns = ["arithmetic_mean", "first_max_value", "second_max_value"]
+    converted = convert_to_ug_m3(
+        np.column_stack([df[column].to_numpy(dtype=float) for column in value_columns]),
+        factors,
     )
+    for i, column in enumerate(value_columns):
+        df[f"{column}_ug_m3"] = converted[:, i]
 
     # Calculate exceedances
-    df["xtrv_cancer"] = _safe_div(df["arithmetic_mean_ug_m3"], df["trv_cancer"])
-    df["xtrv_noncancer"] = _safe_div(df["arithmetic_mean_ug_m3"], df["trv_noncancer"])
-    df["xtrv_acute_first"] = _safe_div(df["first_max_value_ug_m3"], df["trv_acute"])
-    df["xtrv_acute_second"] = _safe_div(df["second_max_value_ug_m3"], df["trv_acute"])
+    df["xtrv_cancer"] = safe_div(df["arithmetic_mean_ug_m3"], df["trv_cancer"])
+    df["xtrv_noncancer"] = safe_div(df["arithmetic_mean_ug_m3"], df["trv_noncancer"])
+    df["xtrv_acute_first"] = safe_div(df["first_max_value_ug_m3"], df["trv_acute"])
+    df["xtrv_acute_second"] = safe_div(df["second_max_value_ug_m3"], df["trv_acute"])
 
     # Create site_code: state_code (2 digits) + county_code (3 digits) + site_number (4 digits)
-    # For Oregon data, default state_code to 41 if missing/invalid
-    # Handle NaN and non-numeric values robustly
-    df["state_code_num"] = pd.to_numeric(df["state_code"], errors="coerce")
-    df["county_code_num"] = pd.to_numeric(df["county_code"], errors="coerce")
-    df["site_number_num"] = pd.to_numeric(df["site_number"], errors="coerce")
-
-    # Default to Oregon state code (41) if missing or invalid
-    df["state_code_num"] = df["state_code_num"].fillna(41).astype(int)
-    df["state_code_num"] = df["state_code_num"].where(df["state_code_num"] == 41, 41)
-
-    # Fill missing county/site codes with 0
-    df["county_code_num"] = df["county_code_num"].fillna(0).astype(int)
-    df["site_number_num"] = df["site_number_num"].fillna(0).astype(int)
-
-    df["site_code"] = (
-        df["state_code_num"].astype(str).str.zfill(2)
-        + df["county_code_num"].astype(str).str.zfill(3)
-        + df["site_number_num"].astype(str).str.zfill(4)
-    )
-
-    # Clean up temporary columns
-    df = df.drop(columns=["state_code_num", "county_code_num", "site_number_num"])
+    # Every row is Oregon (41)
+    df["site_code"] = site_code_from_parts(df["county_code"], df["site_number"])
 
     # Create concentration field in ug/m3 units
     df["ugm3_converted"] = df["arithmetic_mean_ug_m3"]
@@ -238,9 +126,5 @@ def transform_toxics_annual_trv(
         "tenth_percentile",
     ]
 
-    # Ensure all columns exist (fill missing with NaN)
-    for col in output_columns:
-        if col not in df.columns:
-            df[col] = math.nan
-
-    return df[output_columns]
+    # Select in order, filling columns missing from the input with NaN
+    return df.reindex(columns=output_columns)
@@ -8,7 +8,9 @@ credential management and date policy enforcement. All paths point to the data l
 from __future__ import annotations
 
 import os
+import sys
 from datetime import date
+from functools import cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -28,15 +30,35 @@ ENV_URL = os.getenv("ENV_URL")
 STATE = (os.getenv("STATE_CODE") or "").zfill(2)
 
 # Date range for data extraction
-# Raw values from environment - use clamped_bdate() for policy-enforced dates
-BDATE = date.fromisoformat(os.environ["BDATE"])
-EDATE = date.fromisoformat(os.environ["EDATE"])
+# Raw values from environment - use clamped_bdate() for policy-enforced dates.
+# BDATE, EDATE, START_YEAR and END_YEAR are resolved on first access (see
+# __getattr__ below), so importing config does not require them to be set.
+
+
+@cache
+def _env_date(name: str) -> date:
+    """Parse a YYYY-MM-DD date from the environment once; KeyError if unset."""
+    return date.fromisoformat(os.environ[name])
+
+
+_LAZY_DATES = {
+    "BDATE": lambda: _env_date("BDATE"),
+    "EDATE": lambda: _env_date("EDATE"),
+    "START_YEAR": lambda: _env_date("BDATE").year,
+    "END_YEAR": lambda: _env_date("EDATE").year,
+}
+
+
+def __getattr__(name: str):
+    # Module-level fallback (PEP 562), only reached for names not defined above
+    if name in _LAZY_DATES:
+        return _LAZY_DATES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Repository policy: no data extraction before 2005-01-01
 # Use clamped_bdate() in pipelines to enforce this constraint
 _MIN_BDATE = date(2005, 1, 1)
-START_YEAR = BDATE.year
-END_YEAR = EDATE.year
 
 # Data lake root and layer paths
 # All output written to DATAREPO_ROOT data lake, organized by layer and service
@@ -81,10 +103,27 @@ SAMPLE_MONTHS_PER_REQUEST = max(
 # HTTP and concurrency tuning for AQS clients
 AQS_TIMEOUT = int(os.getenv("AQS_TIMEOUT", "120"))
 AQS_RETRIES = int(os.getenv("AQS_RETRIES", "6"))
+AQS_THROTTLE_RETRIES = int(os.getenv("AQS_THROTTLE_RETRIES", "20"))
 AQS_BACKOFF_FACTOR = float(os.getenv("AQS_BACKOFF_FACTOR", "1.5"))
 AQS_RETRY_MAX_WAIT = int(os.getenv("AQS_RETRY_MAX_WAIT", "60"))
+AQS_MAX_RETRY_AFTER = int(os.getenv("AQS_MAX_RETRY_AFTER", "60"))
 AQS_MIN_DELAY = float(os.getenv("AQS_MIN_DELAY", "0"))
 AQS_MAX_RPS = int(os.getenv("AQS_MAX_RPS", "5"))
+# Optional per-host request-rate overrides, e.g. "aqs.epa.gov=5,example.org=10"
+AQS_HOST_RPS = {
+    host.strip(): int(rps)
+    for host, _, rps in (
+        item.partition("=") for item in os.getenv("AQS_HOST_RPS", "").split(",")
+    )
+    if host.strip() and rps.strip()
+}
+AQS_MAX_INFLIGHT = max(1, int(os.getenv("AQS_MAX_INFLIGHT", "8")))
+# Seconds a known-empty past-year (endpoint, parameter, state, date range) result
+# is trusted; current-year requests are always re-fetched. 0 disables
+AQS_EMPTY_CACHE_TTL = int(os.getenv("AQS_EMPTY_CACHE_TTL", str(7 * 24 * 3600)))
+# Seconds a past-year AQS response body is reused from the local cache; 0 disables
+AQS_RESPONSE_CACHE_TTL = int(os.getenv("AQS_RESPONSE_CACHE_TTL", "0"))
+AQS_CHUNK_WORKERS = max(1, int(os.getenv("AQS_CHUNK_WORKERS", "3")))
 AQS_SAMPLE_YEAR_WORKERS = max(1, int(os.getenv("AQS_SAMPLE_YEAR_WORKERS", "3")))
 AQS_SAMPLE_PARAM_WORKERS = max(1, int(os.getenv("AQS_SAMPLE_PARAM_WORKERS", "3")))
 AQS_ANNUAL_YEAR_WORKERS = max(1, int(os.getenv("AQS_ANNUAL_YEAR_WORKERS", "3")))
@@ -163,4 +202,5 @@ def clamped_bdate() -> date:
     for AQS API requests so historical backfills won't request data earlier
     than 2005-01-01 even if the environment BDATE is set earlier.
     """
-    return BDATE if BDATE >= _MIN_BDATE else _MIN_BDATE
+    # Read through the module attribute so an overridden config.BDATE is honoured
+    return max(sys.modules[__name__].BDATE, _MIN_BDATE)
@@ -16,6 +16,7 @@ from threading import Lock
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 import config
 
@@ -154,6 +155,11 @@ def make_session(timeout: Optional[int] = None) -> requests.Session:
     
     session = requests.Session()
     session.headers.update({"User-Agent": "soar-pipeline/1.0"})
+
+    # Keep-alive pool so repeated station requests reuse TCP/TLS connections
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     
     # Add HTTP Basic Auth if credentials are available
     if ENV_USER and ENV_KEY:
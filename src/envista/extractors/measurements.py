@@ -33,7 +33,13 @@ def _get_session() -> requests.Session:
         _session_local.session = session
     return session
 
-def get_envista_hourly(station_id: str, channel_id: str, from_date: str, to_date: str) -> pd.DataFrame | None:
+def get_envista_hourly(
+    station_id: str,
+    channel_id: str,
+    from_date: str,
+    to_date: str,
+    session: requests.Session | None = None,
+) -> pd.DataFrame | None:
     """Retrieve Envista measurement data for a specific site and channel.
 
     Fetches hourly measurement data from a specific station's channel over
@@ -45,6 +51,7 @@ def get_envista_hourly(station_id: str, channel_id: str, from_date: str, to_date
         channel_id: Envista channel ID
         from_date: Start date in ISO format (e.g., '2022-01-01')
         to_date: End date in ISO format (e.g., '2022-12-31')
+        session: Optional session to reuse; defaults to this thread's session
 
     Returns:
         DataFrame with parsed measurements, or None if request fails or no data
@@ -61,7 +68,8 @@ def get_envista_hourly(station_id: str, channel_id: str, from_date: str, to_date
                  f"from={from_date}, to={to_date}")
     
     try:
-        session = _get_session()
+        if session is None:
+            session = _get_session()
         response = _env_client.fetch_json(session, query)
         
         if response is None:
@@ -100,7 +108,13 @@ def get_envista_hourly(station_id: str, channel_id: str, from_date: str, to_date
                      f"channel={channel_id}: {e}")
         return None
 
-def get_envista_daily(station_id: str, channel_id: str, from_date: str, to_date: str) -> pd.DataFrame | None:
+def get_envista_daily(
+    station_id: str,
+    channel_id: str,
+    from_date: str,
+    to_date: str,
+    session: requests.Session | None = None,
+) -> pd.DataFrame | None:
     """Retrieve Envista averaged data for a specific site and channel.
 
     Fetches daily averaged data from a specific station's channel over
@@ -112,6 +126,7 @@ def get_envista_daily(station_id: str, channel_id: str, from_date: str, to_date:
         channel_id: Envista channel ID
         from_date: Start date in ISO format (e.g., '2022-01-01')
         to_date: End date in ISO format (e.g., '2022-12-31')
+        session: Optional session to reuse; defaults to this thread's session
 
     Returns:
         DataFrame with parsed averaged data, or None if request fails or no data
@@ -129,7 +144,8 @@ def get_envista_daily(station_id: str, channel_id: str, from_date: str, to_date:
                  f"from={from_date}, to={to_date}")
     
     try:
-        session = _get_session()
+        if session is None:
+            session = _get_session()
         response = _env_client.fetch_json(session, query)
         
         if response is None:
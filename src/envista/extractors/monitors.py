@@ -2,6 +2,7 @@ from __future__ import annotations
 from datetime import datetime
 import threading
 
+import numpy as np
 import pandas as pd
 import requests
 
@@ -104,6 +105,32 @@ def get_envista_stations() -> pd.DataFrame:
         logger.error(f"Failed to retrieve Envista stations: {e}")
         return pd.DataFrame()
 
+# Monitor fields kept from the API response: (output column, API key, default
+# used when the key is missing)
+_MONITOR_FIELDS = [
+    ('channel_id', 'channelId', -9999),
+    ('monitor_name', 'name', 'none'),
+    ('monitor_alias', 'alias', 'none'),
+    ('monitor_active', 'active', False),
+    ('type_id', 'typeId', -9999),
+    ('pollutant_id', 'pollutantId', -9999),
+    ('units', 'units', 'none'),
+    ('unit_id', 'unitID', -9999),
+    ('description', 'description', None),
+    ('map_view', 'mapView', False),
+    ('is_index', 'isIndex', False),
+    ('pollutant_category', 'PollutantCategory', -9999),
+    ('numeric_format', 'NumericFormat', 'none'),
+    ('low_range', 'LowRange', None),
+    ('high_range', 'HighRange', None),
+    ('state', 'state', -9999),
+    ('pct_valid', 'PctValid', None),
+    ('monitor_title', 'MonitorTitle', 'none'),
+    ('mon_start_date', 'MON_StartDate', None),
+    ('mon_end_date', 'MON_EndDate', None),
+]
+
+
 def build_envista_metadata(envista_stations: pd.DataFrame) -> pd.DataFrame:
     """Build a complete Envista monitor metadata table from station data.
 
@@ -117,49 +144,30 @@ def build_envista_metadata(envista_stations: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with one row per station-monitor combination.
     """
-    monitor_rows = []
-    
-    for idx, station_info in envista_stations.iterrows():
-        # Get station-level metadata (excluding monitors column)
-        station_meta = station_info.drop('monitors', errors='ignore')
-        
-        # Get monitors for this station
-        monitors = station_info.get('monitors', [])
-        if not isinstance(monitors, list):
-            monitors = [monitors] if monitors else []
-        
-        # Create a row for each monitor
-        for monitor in monitors:
-            # Start with station metadata
-            monitor_dict = station_meta.to_dict()
-            
-            # Add all monitor fields from the API response
-            monitor_dict.update({
-                'channel_id': monitor.get('channelId', -9999),
-                'monitor_name': monitor.get('name', 'none'),
-                'monitor_alias': monitor.get('alias', 'none'),
-                'monitor_active': monitor.get('active', False),
-                'type_id': monitor.get('typeId', -9999),
-                'pollutant_id': monitor.get('pollutantId', -9999),
-                'units': monitor.get('units', 'none'),
-                'unit_id': monitor.get('unitID', -9999),
-                'description': monitor.get('description'),
-                'map_view': monitor.get('mapView', False),
-                'is_index': monitor.get('isIndex', False),
-                'pollutant_category': monitor.get('PollutantCategory', -9999),
-                'numeric_format': monitor.get('NumericFormat', 'none'),
-                'low_range': monitor.get('LowRange'),
-                'high_range': monitor.get('HighRange'),
-                'state': monitor.get('state', -9999),
-                'pct_valid': monitor.get('PctValid'),
-                'monitor_title': monitor.get('MonitorTitle', 'none'),
-                'mon_start_date': monitor.get('MON_StartDate'),
-                'mon_end_date': monitor.get('MON_EndDate'),
-            })
-            monitor_rows.append(monitor_dict)
-    
-    monitor_data = pd.DataFrame(monitor_rows)
-    
+    if 'monitors' in envista_stations.columns:
+        monitor_lists = [
+            monitors if isinstance(monitors, list) else ([monitors] if monitors else [])
+            for monitors in envista_stations['monitors']
+        ]
+    else:
+        monitor_lists = [[] for _ in range(len(envista_stations))]
+
+    # Flatten the monitors once; each station row is repeated once per monitor
+    # by position instead of being converted to a dict per monitor
+    monitors = [monitor for station_monitors in monitor_lists for monitor in station_monitors]
+    if not monitors:
+        return pd.DataFrame()
+    station_rows = np.repeat(
+        np.arange(len(envista_stations)), [len(m) for m in monitor_lists]
+    )
+    monitor_data = envista_stations.drop(columns='monitors', errors='ignore').take(station_rows)
+    monitor_data = monitor_data.reset_index(drop=True)
+
+    # Add the monitor fields column by column; a field that shares its name
+    # with a station column replaces it in place
+    for column, key, default in _MONITOR_FIELDS:
+        monitor_data[column] = pd.Series([monitor.get(key, default) for monitor in monitors])
+
     # Apply column renaming for station fields
     rename_dict = {
         'shortName': 'site',
@@ -175,11 +183,13 @@ def build_envista_metadata(envista_stations: pd.DataFrame) -> pd.DataFrame:
     # Convert all columns to lowercase
     monitor_data.columns = monitor_data.columns.str.lower()
     
-    # Flatten any remaining list columns to strings
-    for col in monitor_data.columns:
-        if monitor_data[col].dtype == 'object':
-            monitor_data[col] = monitor_data[col].apply(
-                lambda x: ', '.join(map(str, x)) if isinstance(x, list) else x
+    # Flatten any remaining list columns to strings. Only the list cells of
+    # object columns are joined; columns without lists are left untouched
+    for col in monitor_data.columns[monitor_data.dtypes == 'object']:
+        is_list = monitor_data[col].map(type).eq(list)
+        if is_list.any():
+            monitor_data.loc[is_list, col] = monitor_data.loc[is_list, col].map(
+                lambda x: ', '.join(map(str, x))
             )
     
     return monitor_data
@@ -10,6 +10,8 @@ from pathlib import Path
 from .calculate_aqi import calculate_aqi
 import pandas as pd
 
+from loaders.filesystem import read_frame
+
 def transform_env_daily(year: str, raw_daily_files: list[Path], unique_monitors: pd.DataFrame) -> pd.DataFrame:
     """Transform raw Envista daily data for a given year.
 
@@ -18,7 +20,7 @@ def transform_env_daily(year: str, raw_daily_files: list[Path], unique_monitors:
     and returns a cleaned DataFrame.
 
     Args:
-        input_path (Path): Path to the raw daily data CSV file.
+        raw_daily_files (list[Path]): Raw daily data parquet or CSV files.
         unique_monitors (pd.DataFrame): DataFrame containing unique monitor information.
 
     Returns:
@@ -32,7 +34,7 @@ def transform_env_daily(year: str, raw_daily_files: list[Path], unique_monitors:
     frames = []
     for file_path in raw_daily_files:
         try:
-            df = pd.read_csv(file_path)
+            df = read_frame(file_path)
             if not df.empty:
                 frames.append(df)
         except Exception as e:
@@ -103,9 +105,11 @@ def transform_env_daily_for_year(year: str, raw_daily_dir: Path, unique_monitors
         Transformed DataFrame for the year
     """
     # Find all daily files for this year
-    # Files are named like env_daily_{pollutant}_{year}.csv
-    pattern = f"env_daily_*_{year}.csv"
-    daily_files = list(raw_daily_dir.glob(pattern))
+    # Files are named like env_daily_{pollutant}_{year}.parquet; CSV files
+    # written before the parquet switch are used only when no parquet exists
+    daily_files = list(raw_daily_dir.glob(f"env_daily_*_{year}.parquet"))
+    if not daily_files:
+        daily_files = list(raw_daily_dir.glob(f"env_daily_*_{year}.csv"))
 
     if not daily_files:
         print(f"No daily files found for year {year}")
@@ -11,6 +11,8 @@ from typing import List
 
 import pandas as pd
 
+from loaders.filesystem import read_frame
+
 # Fixed field values that align Envista data with AQS parameter conventions
 _PARAMETER_CODE = "88502"
 _POC = 99
@@ -47,7 +49,7 @@ def transform_env_hourly(
 ) -> pd.DataFrame:
     """Transform raw Envista hourly PM2.5 files into hourly records.
 
-    Reads one or more raw Envista hourly CSV files, filters out sentinel
+    Reads one or more raw Envista hourly parquet or CSV files, filters out sentinel
     -9999 values, joins to monitor metadata to obtain site_code, splits
     the datetime into date_local and time_local, maps the validity flag,
     and populates fixed AQS-convention fields.
@@ -55,7 +57,7 @@ def transform_env_hourly(
     No validity_indicator filtering is applied — all records are kept.
 
     Args:
-        raw_files: List of paths to raw Envista hourly CSV files.
+        raw_files: List of paths to raw Envista hourly parquet or CSV files.
         unique_monitors: DataFrame with at least columns ``station_id``
             and ``stations_tag`` (the AQS-formatted site_code).
 
@@ -69,7 +71,7 @@ def transform_env_hourly(
     frames = []
     for file_path in raw_files:
         try:
-            df = pd.read_csv(file_path)
+            df = read_frame(file_path)
             if not df.empty:
                 frames.append(df)
         except Exception as e:
@@ -147,19 +149,21 @@ def transform_env_hourly_for_year(
 ) -> pd.DataFrame:
     """Transform Envista hourly PM2.5 data for a specific year.
 
-    Globs all files matching env_hourly_pm25_{year}.csv in raw_env_sample_dir,
-    then delegates to transform_env_hourly.
+    Globs all files matching env_hourly_pm25_{year}.parquet in raw_env_sample_dir
+    (falling back to legacy env_hourly_pm25_{year}.csv files), then delegates to
+    transform_env_hourly.
 
     Args:
         year: Four-digit year string (e.g. "2023").
-        raw_env_sample_dir: Directory containing raw Envista hourly CSV files.
+        raw_env_sample_dir: Directory containing raw Envista hourly files.
         unique_monitors: DataFrame with ``station_id`` and ``stations_tag`` columns.
 
     Returns:
         Transformed DataFrame for the year.
     """
-    pattern = f"env_hourly_pm25_{year}.csv"
-    raw_files = list(raw_env_sample_dir.glob(pattern))
+    raw_files = list(raw_env_sample_dir.glob(f"env_hourly_pm25_{year}.parquet"))
+    if not raw_files:
+        raw_files = list(raw_env_sample_dir.glob(f"env_hourly_pm25_{year}.csv"))
 
     if not raw_files:
         print(f"  No Envista hourly files found for year {year} in {raw_env_sample_dir}")
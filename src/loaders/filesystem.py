@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
+import csv
 import json
 import os
 import tempfile
 from pathlib import Path
+from threading import Lock
 
 import pandas as pd
 
 
 def write_parquet(frame: pd.DataFrame, path: Path) -> None:
-    """Write a DataFrame to parquet, creating parent folders when needed."""
+    """Write a DataFrame to snappy-compressed parquet, creating parent folders when needed."""
     destination = Path(path)
     destination.parent.mkdir(parents=True, exist_ok=True)
-    frame.to_parquet(destination, index=False)
+    frame.to_parquet(destination, engine="pyarrow", compression="snappy", index=False)
+
+
+def read_frame(path: Path | str) -> pd.DataFrame:
+    """Read a CSV or parquet file into a DataFrame based on its suffix."""
+    source = Path(path)
+    if source.suffix == ".parquet":
+        return pd.read_parquet(source)
+    return pd.read_csv(source)
 
 
 def write_csv(frame: pd.DataFrame, path: Path) -> None:
@@ -39,6 +49,55 @@ def append_csv(frame: pd.DataFrame, path: Path) -> None:
     frame.to_csv(destination, mode="a", header=write_header, index=False)
 
 
+def _csv_cell(value):
+    # Missing values are written as empty fields, matching DataFrame.to_csv
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
+
+class CsvAppender:
+    """Append DataFrames to CSV files through stdlib csv writers kept open.
+
+    Each destination is opened once and reused for later appends, skipping the
+    re-open and pandas writer setup that ``append_csv`` pays per call. As with
+    ``append_csv`` a header is written only for new files. Use as a context
+    manager so the handles are closed.
+    """
+
+    def __init__(self) -> None:
+        self._writers: dict[Path, tuple] = {}
+
+    def append(self, frame: pd.DataFrame, path: Path | str) -> None:
+        destination = Path(path)
+        entry = self._writers.get(destination)
+        if entry is None:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            write_header = not destination.exists()
+            fh = open(destination, "a", newline="", encoding="utf-8")
+            writer = csv.writer(fh, lineterminator=os.linesep)
+            if write_header:
+                writer.writerow(frame.columns)
+            entry = self._writers[destination] = (fh, writer)
+        entry[1].writerows(
+            [_csv_cell(value) for value in row]
+            for row in frame.itertuples(index=False, name=None)
+        )
+
+    def close(self) -> None:
+        for fh, _writer in self._writers.values():
+            fh.close()
+        self._writers.clear()
+
+    def __enter__(self) -> CsvAppender:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
 def atomic_write_text(path: Path | str, text: str, encoding: str = "utf-8") -> None:
     """Atomically write text to `path` by writing to a temp file then replacing.
 
@@ -84,3 +143,34 @@ def atomic_write_json(path: Path | str, obj) -> None:
     """
     text = json.dumps(obj, ensure_ascii=False, indent=2)
     atomic_write_text(path, text)
+
+
+class AuditLogger:
+    """Collect audit records in memory and write them as one JSON-lines file.
+
+    Replaces a per-record ``atomic_write_json`` with a single atomic write per
+    flush. Records are kept after flushing, so each flush rewrites the full
+    file and a later flush never loses earlier records.
+    """
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self._records: list[dict] = []
+        self._flushed = 0
+        self._lock = Lock()
+
+    def log(self, record: dict) -> None:
+        with self._lock:
+            self._records.append(record)
+
+    def flush(self, path: Path | str | None = None) -> None:
+        """Write all records to ``path`` (or the configured path) if any are new."""
+        destination = path if path is not None else self.path
+        with self._lock:
+            if destination is None or len(self._records) == self._flushed:
+                return
+            text = "".join(
+                json.dumps(record, ensure_ascii=False) + "\n" for record in self._records
+            )
+            self._flushed = len(self._records)
+        atomic_write_text(destination, text)
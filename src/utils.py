@@ -7,10 +7,17 @@ This mapping is used to organize output files by pollutant category.
 
 from __future__ import annotations
 
+import re
 from typing import Dict
 
 import pandas as pd
 
+# Patterns for sanitize_filename, compiled once
+_WHITESPACE_RE = re.compile(r"\s+")
+_UNSAFE_CHARS_RE = re.compile(r"[^A-Za-z0-9._-]")
+_REPEATED_SEP_RE = re.compile(r"[-_]{2,}")
+_EDGE_SEP_RE = re.compile(r"(^[^A-Za-z0-9]+)|([^A-Za-z0-9]+$)")
+
 
 def load_parameter_groups(csv_path: str = "ops/dimPollutant.csv") -> Dict[str, str]:
     """Load parameter code to group_store mapping from pollutant dimension table.
@@ -96,3 +103,41 @@ def get_toxics_parameters(csv_path: str = "ops/dimPollutant.csv") -> Dict[str, s
     mapping = toxics_df.set_index("aqs_parameter")["analyte_name_deq"].to_dict()
 
     return mapping
+
+
+def sanitize_filename(name: str, max_len: int = 80) -> str:
+    """Convert parameter name to filesystem-safe filename component.
+
+    Transforms human-readable names like "PM2.5 - Local Conditions" into
+    safe filenames like "PM2-5-Local-Conditions".
+
+    Rules:
+        - Whitespace → single dash
+        - Remove unsafe characters (keep only alphanumeric, dash, underscore, dot)
+        - Collapse repeated separators
+        - Strip leading/trailing separators
+        - Limit length to max_len characters
+
+    Args:
+        name: Parameter name to sanitize
+        max_len: Maximum allowed filename length (default 80)
+
+    Returns:
+        Filesystem-safe string suitable for use in filenames
+    """
+    if not name:
+        return "unknown"
+
+    # Normalize whitespace to single dash
+    s = _WHITESPACE_RE.sub("-", name)
+    # Remove unsafe characters (keep only alphanumeric, dot, dash, underscore)
+    s = _UNSAFE_CHARS_RE.sub("", s)
+    # Collapse multiple consecutive dashes/underscores
+    s = _REPEATED_SEP_RE.sub("-", s)
+    # Strip leading/trailing non-alphanumeric characters
+    s = _EDGE_SEP_RE.sub("", s)
+    if not s:
+        return "unknown"
+    if len(s) > max_len:
+        s = s[:max_len].rstrip("-_.")
+    return s
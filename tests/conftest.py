@@ -4,8 +4,8 @@ This prepends the repository `src` directory to sys.path so tests can import
 the `soar` package without installing it into the environment.
 
 Environment variable stubs are set before any src import so that config.py
-(which requires BDATE, EDATE, and DATAREPO_ROOT at module load time) does not
-raise KeyError when tests run without a real .env file.  Values already
+(which requires DATAREPO_ROOT at module load time, and BDATE/EDATE when they
+are first read) does not raise KeyError when tests run without a real .env file.  Values already
 present in the environment take precedence via os.environ.setdefault().
 """
 
@@ -1,11 +1,22 @@
-from datetime import datetime, timezone
+import io
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 
+import pandas as pd
 import pytest
 import requests
 
 from aqs import _client
 
 
+@pytest.fixture(autouse=True)
+def _fresh_health_cache(monkeypatch):
+    # circuit state is cached in memory; start every test from disk
+    monkeypatch.setattr(_client, "_health_state", None)
+    monkeypatch.setattr(_client, "_health_dirty", False)
+
+
 class DummyResp:
     def __init__(self, status_code=500, headers=None, content=b"{}"):
         self.status_code = status_code
@@ -64,3 +75,218 @@ def test_reset_circuit_allows_requests(tmp_path, monkeypatch):
     # reset
     _client._reset_circuit()
     assert _client.circuit_is_open() is False
+
+
+def test_long_retry_after_raises_quota_exhausted(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        _client, "_health_path", lambda: str(tmp_path / "aqs_health.json")
+    )
+    monkeypatch.setattr(_client, "_throttle_mode", False)
+    session = DummySession([DummyResp(429, headers={"Retry-After": "3600"})])
+
+    with pytest.raises(_client.QuotaExhaustedError) as excinfo:
+        _client.fetch_json(session, "https://example.invalid/api")
+    assert excinfo.value.retry_after == 3600
+
+
+def test_throttle_retries_do_not_consume_error_budget(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        _client, "_health_path", lambda: str(tmp_path / "aqs_health.json")
+    )
+    monkeypatch.setattr(_client, "_throttle_mode", False)
+    monkeypatch.setattr(_client, "_AQS_RETRIES", 1)
+    monkeypatch.setattr(_client, "_sleep_backoff", lambda *args, **kwargs: None)
+    responses = [DummyResp(429, headers={"Retry-After": "0"}) for _ in range(3)]
+    session = DummySession(responses)
+
+    assert _client.fetch_json(session, "https://example.invalid/api") == {
+        "status": "error"
+    }
+    assert _client._throttle_mode is False
+
+
+class StreamResp(DummyResp):
+    def __init__(self, body: bytes):
+        super().__init__(status_code=200)
+        self.content = body
+        self.raw = io.BytesIO(body)
+
+    def close(self):
+        self.raw.close()
+
+
+class StreamSession:
+    def __init__(self, body: bytes):
+        self._body = body
+
+    def get(self, url, timeout=None, stream=False):
+        return StreamResp(self._body)
+
+
+def test_fetch_rows_to_csv_streams_data_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        _client, "_health_path", lambda: str(tmp_path / "aqs_health.json")
+    )
+    body = (
+        b'{"Header": [{"status": "Success"}], "Data": ['
+        b'{"site_number": "0080", "arithmetic_mean": 1.25},'
+        b'{"site_number": "0001", "arithmetic_mean": null}]}'
+    )
+    out_path = tmp_path / "aqs_annual_toxics_2021.csv"
+
+    assert _client.fetch_rows_to_csv(StreamSession(body), "u", out_path) == 2
+    assert _client.fetch_rows_to_csv(StreamSession(body), "u", out_path) == 2
+
+    lines = out_path.read_text(encoding="utf-8").splitlines()
+    assert lines == [
+        "site_number,arithmetic_mean",
+        "0080,1.25",
+        "0001,",
+        "0080,1.25",
+        "0001,",
+    ]
+
+
+def test_fetch_rows_to_csv_retries_truncated_body_without_partial_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        _client, "_health_path", lambda: str(tmp_path / "aqs_health.json")
+    )
+    monkeypatch.setattr(_client, "_sleep_backoff", lambda *a, **k: None)
+    body = (
+        b'{"Header": [{"status": "Success"}], "Data": ['
+        b'{"site_number": "0080", "arithmetic_mean": 1.25},'
+        b'{"site_number": "0001", "arithmetic_mean": 2.5}]}'
+    )
+    bodies = [body[:-20], body]
+
+    class FlakySession:
+        def get(self, url, timeout=None, stream=False):
+            return StreamResp(bodies.pop(0))
+
+    out_path = tmp_path / "aqs_annual_toxics_2021.csv"
+
+    assert _client.fetch_rows_to_csv(FlakySession(), "u", out_path) == 2
+
+    lines = out_path.read_text(encoding="utf-8").splitlines()
+    assert lines == ["site_number,arithmetic_mean", "0080,1.25", "0001,2.5"]
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".part"] == []
+
+
+def test_fetch_rows_to_csv_closes_throttled_streamed_response(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        _client, "_health_path", lambda: str(tmp_path / "aqs_health.json")
+    )
+    monkeypatch.setattr(_client, "_sleep_backoff", lambda *a, **k: None)
+    body = b'{"Header": [{"status": "Success"}], "Data": [{"site_number": "0080"}]}'
+    throttled = StreamResp(b"")
+    throttled.status_code = 429
+    responses = [throttled, StreamResp(body)]
+
+    class ThrottledSession:
+        def get(self, url, timeout=None, stream=False):
+            return responses.pop(0)
+
+    out_path = tmp_path / "aqs_annual_toxics_2021.csv"
+
+    assert _client.fetch_rows_to_csv(ThrottledSession(), "u", out_path) == 1
+    assert throttled.raw.closed
+
+
+def test_fetch_df_parallel_preserves_input_order(monkeypatch):
+    def fake_fetch_df(session, url):
+        # later URLs finish first
+        time.sleep(0.05 * (3 - int(url)))
+        return pd.DataFrame({"url": [url]})
+
+    monkeypatch.setattr(_client, "fetch_df", fake_fetch_df)
+
+    results = list(_client.fetch_df_parallel(None, ["0", "1", "2"], max_workers=3))
+
+    assert [url for url, _df in results] == ["0", "1", "2"]
+    assert [df.loc[0, "url"] for _url, df in results] == ["0", "1", "2"]
+
+
+def test_parse_retry_after_accepts_http_date():
+    future = datetime.now(timezone.utc) + timedelta(seconds=120)
+    resp = DummyResp(429, headers={"Retry-After": format_datetime(future, usegmt=True)})
+
+    assert 100 <= _client._parse_retry_after(resp) <= 120
+
+
+def test_empty_result_cache_round_trip(tmp_path):
+    cache = _client.EmptyResultCache(tmp_path / "empty.db", ttl=3600)
+    key = "annualData|45201|41|20210101|20211231"
+
+    assert cache.contains(key) is False
+    cache.put(key)
+    assert cache.contains(key) is True
+    assert _client.EmptyResultCache(tmp_path / "empty.db", ttl=0).contains(key) is False
+
+    # Current-year data may still be published, so it is never cached
+    this_year = datetime.now().year
+    current = f"annualData|45201|41|{this_year}0101|{this_year}1231"
+    cache.put(current)
+    assert cache.contains(current) is False
+
+
+def test_response_cache_serves_past_year_bodies(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        _client, "_health_path", lambda: str(tmp_path / "aqs_health.json")
+    )
+    cache = _client.ResponseCache(tmp_path / "responses.db", ttl=3600)
+    monkeypatch.setattr(_client, "response_cache", cache)
+    body = b'{"Header": [{"status": "Success"}], "Data": [{"site_number": "0080"}]}'
+    url = "https://aqs.epa.gov/data/api/annualData/byState?param=45201&bdate=20210101&edate=20211231"
+    session = DummySession([StreamResp(body)])
+
+    assert _client.fetch_json(session, url)["Data"] == [{"site_number": "0080"}]
+    # Second call is answered from the cache; the session has nothing queued
+    session.get = None
+    assert _client.fetch_json(session, url)["Data"] == [{"site_number": "0080"}]
+    assert cache.cacheable(url.replace("edate=20211231", "edate=99991231")) is False
+
+
+def test_response_cache_path_retries_invalid_json(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        _client, "_health_path", lambda: str(tmp_path / "aqs_health.json")
+    )
+    monkeypatch.setattr(_client, "_sleep_backoff", lambda *a, **k: None)
+    cache = _client.ResponseCache(tmp_path / "responses.db", ttl=3600)
+    monkeypatch.setattr(_client, "response_cache", cache)
+    body = b'{"Header": [{"status": "Success"}], "Data": [{"site_number": "0080"}]}'
+    url = "https://aqs.epa.gov/data/api/annualData/byState?param=45201&bdate=20210101&edate=20211231"
+    session = DummySession([StreamResp(body[:-5]), StreamResp(body)])
+
+    assert _client.fetch_json(session, url)["Data"] == [{"site_number": "0080"}]
+    assert cache.get(url) == body
+
+
+def test_fetch_rows_to_csv_reports_header_status(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        _client, "_health_path", lambda: str(tmp_path / "aqs_health.json")
+    )
+    body = b'{"Header": [{"status": "No data matched your selection"}], "Data": []}'
+    header: dict = {}
+
+    rows = _client.fetch_rows_to_csv(
+        StreamSession(body), "u", tmp_path / "out.csv", header=header
+    )
+
+    assert rows == 0
+    assert not (tmp_path / "out.csv").exists()
+    assert _client.is_confirmed_empty(header["status"]) is True
+    assert _client.is_confirmed_empty("Failed") is False
+
+
+def test_records_to_frame_matches_pandas_and_handles_ragged_rows():
+    rows = [
+        {"site_number": "0080", "sample_measurement": 1.5, "qualifier": None},
+        {"site_number": "0001", "sample_measurement": None, "qualifier": "V"},
+    ]
+    pd.testing.assert_frame_equal(_client.records_to_frame(rows), pd.DataFrame(rows))
+
+    ragged = rows + [{"site_number": "0002", "extra": 1}]
+    pd.testing.assert_frame_equal(
+        _client.records_to_frame(ragged), pd.DataFrame.from_records(ragged)
+    )
+    assert _client.records_to_frame([]).empty
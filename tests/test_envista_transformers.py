@@ -11,7 +11,10 @@ from datetime import datetime
 import pandas as pd
 import pytest
 
-from envista.transformers.transform_env import transform_env_daily
+from envista.transformers.transform_env import (
+    transform_env_daily,
+    transform_env_daily_for_year,
+)
 from envista.transformers.calculate_aqi import (
     pm25_to_aqi_old,
     pm25_to_aqi_new,
@@ -401,3 +404,25 @@ class TestDateFormatAndAQIIntegration:
         
         assert not before_cutoff.empty
         assert not after_cutoff.empty
+
+    def test_transform_env_daily_for_year_prefers_parquet(self, tmp_path):
+        """Test that parquet raw files are read and legacy CSVs are ignored when both exist."""
+        df_envista = pd.DataFrame({
+            "data_datetime": ["2024-05-07T10:00:00", "2024-05-08T10:00:00"],
+            "data_channels_value": [8.0, 12.0],
+            "data_channels_name": ["PM2.5"] * 2,
+            "data_channels_valid": [True] * 2,
+            "stationId": ["SITE001"] * 2,
+        })
+        df_monitors = pd.DataFrame({
+            "station_id": ["SITE001"],
+            "stations_tag": ["TEST_SITE"],
+        })
+
+        df_envista.to_parquet(tmp_path / "env_daily_pm25_2024.parquet", index=False)
+        df_envista.to_csv(tmp_path / "env_daily_pm25_2024.csv", index=False)
+
+        result = transform_env_daily_for_year("2024", tmp_path, df_monitors)
+
+        assert len(result) == 2
+        assert result["date_local"].tolist() == ["2024-05-07", "2024-05-08"]
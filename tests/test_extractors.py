@@ -1,6 +1,8 @@
 import pandas as pd
+import pytest
+import requests
 
-from aqs.extractors import monitors
+from aqs.extractors import measurements, monitors
 
 
 def test_build_aqs_requests_splits_years():
@@ -18,22 +20,61 @@ def test_build_aqs_requests_splits_years():
     assert "edate=20210301" in urls[2]
 
 
-def test_fetch_aqs_response_and_standardize_from_fixture(monkeypatch):
-    # Read fixture and ensure fetch_aqs_response can accept local file via monkeypatch
-    fixture = pd.read_csv("tests/fixtures/sample_monitors.csv")
+def test_add_site_code_pads_each_part():
+    df = pd.DataFrame(
+        {
+            "state_code": ["41", "41", "41"],
+            "county_code": ["51", "1000", "51"],
+            "site_number": ["80", "0", "12345"],
+        }
+    )
+
+    out = monitors._add_site_code(df)
+
+    # Out-of-range parts must not carry into the neighbouring field
+    assert out["site_code"].tolist() == ["410510080", "4110000000", "4105112345"]
+
+
+class FakeResp:
+    def __init__(self, payload=None, content=None, status_code=200):
+        self._payload = payload
+        self.content = content
+        self.status_code = status_code
+        self.headers = {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(response=self)
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    """Answers every GET with the same canned response, recording (url, timeout).
+
+    ``timeout=None`` leaves the attribute unset, like a plain requests.Session.
+    """
+
+    def __init__(self, payload=None, content=None, timeout=30):
+        self.calls = []
+        self._resp = FakeResp(payload, content)
+        if timeout is not None:
+            self.timeout = timeout
 
-    def fake_get(url):
-        class FakeResp:
-            def raise_for_status(self):
-                return None
+    def get(self, url, timeout=None, **kwargs):
+        self.calls.append((url, timeout))
+        return self._resp
 
-            def json(self):
-                # emulate AQS JSON envelope [header, data]
-                return [{"header": "meta"}, fixture.to_dict(orient="records")]
 
-        return FakeResp()
+def test_fetch_aqs_response_and_standardize_from_fixture(monkeypatch):
+    # Read fixture and ensure fetch_aqs_response can accept local file via monkeypatch
+    fixture = pd.read_csv("tests/fixtures/sample_monitors.csv")
+    # emulate AQS JSON envelope [header, data]
+    session = FakeSession(payload=[{"header": "meta"}, fixture.to_dict(orient="records")])
 
-    monkeypatch.setattr(monitors.requests, "get", fake_get)
+    # Calls without a session go through the module's shared session
+    monkeypatch.setattr(monitors, "_shared_session", lambda: session)
 
     urls = ["https://example.invalid/a"]
     df = monitors.fetch_aqs_response(urls[0])
@@ -43,3 +84,123 @@ def test_fetch_aqs_response_and_standardize_from_fixture(monkeypatch):
     df.loc[0, "sample_measurement"] = 0.025
     # run basic standardization steps inline here (we'll rely on transformer tests for full coverage)
     assert df.loc[0, "sample_measurement"] == 0.025
+
+
+def test_fetch_aqs_response_uses_given_session_timeout():
+    session = FakeSession(
+        payload={"Header": [{"status": "Success"}], "Data": [{"site_number": "0001"}]}
+    )
+
+    df = monitors.fetch_aqs_response("https://example.invalid/a", session=session)
+    assert len(df) == 1
+    assert session.calls == [("https://example.invalid/a", 30)]
+
+
+def test_fetch_aqs_response_accepts_session_without_timeout():
+    session = FakeSession(
+        payload={"Header": [{"status": "Success"}], "Data": [{"site_number": "0001"}]},
+        timeout=None,
+    )
+
+    df = monitors.fetch_aqs_response("https://example.invalid/a", session=session)
+    assert len(df) == 1
+    assert session.calls == [("https://example.invalid/a", monitors._client._DEFAULT_TIMEOUT)]
+
+
+def test_fetch_aqs_response_reuses_cached_past_year_body(tmp_path, monkeypatch):
+    cache = monitors._client.ResponseCache(tmp_path / "responses.db", ttl=3600)
+    monkeypatch.setattr(monitors._client, "response_cache", cache)
+    body = b'{"Header": [{"status": "Success"}], "Data": [{"site_number": "0080"}]}'
+    session = FakeSession(content=body)
+
+    url = "https://aqs.epa.gov/data/api/monitors/byState?param=88101&bdate=20200101&edate=20201231&state=41"
+    first = monitors.fetch_aqs_response(url, session=session)
+    second = monitors.fetch_aqs_response(url, session=session)
+
+    assert len(session.calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_fetch_aqs_response_retries_server_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        monitors._client, "_health_path", lambda: str(tmp_path / "aqs_health.json")
+    )
+    monkeypatch.setattr(monitors._client, "_health_state", None)
+    monkeypatch.setattr(monitors._client, "_sleep_backoff", lambda *a, **k: None)
+    session = FakeSession()
+    responses = [
+        FakeResp(status_code=500),
+        FakeResp({"Header": [{"status": "Success"}], "Data": [{"site_number": "0001"}]}),
+    ]
+    session.get = lambda url, **kwargs: responses.pop(0)
+
+    df = monitors.fetch_aqs_response("https://example.invalid/a", session=session)
+
+    assert df["site_number"].tolist() == ["0001"]
+    assert responses == []
+
+
+def test_fetch_monitors_tags_rows_with_seed_parameter(monkeypatch):
+    requested = []
+
+    def fake_parallel(session, urls):
+        for url in urls:
+            requested.append(url)
+            yield url, pd.DataFrame({"site_number": ["0080"]})
+
+    monkeypatch.setattr(monitors._client, "fetch_df_parallel", fake_parallel)
+
+    df = monitors.fetch_monitors(["88101", "44201"], "2020-01-01", "2020-12-31", "06", session=object())
+
+    assert df["seed_parameter_code"].tolist() == ["88101", "44201"]
+    assert all("state=06" in url for url in requested)
+
+
+def test_fetch_samples_for_parameter_streams_chunks_to_parquet(tmp_path, monkeypatch):
+    chunks = [
+        ("2020", pd.DataFrame({"site_number": ["0080"], "sample_measurement": [1.5], "qualifier": [None]})),
+        ("2020", pd.DataFrame()),
+        ("2021", pd.DataFrame({"site_number": ["0001"], "sample_measurement": [2.0], "qualifier": ["V"]})),
+    ]
+    monkeypatch.setattr(measurements, "fetch_samples_by_state", lambda *a, **k: iter(chunks))
+    out_path = tmp_path / "samples" / "88101.parquet"
+
+    result = measurements.fetch_samples_for_parameter(
+        "88101", "2020-01-01", "2021-12-31", "41", session=object(), output_path=out_path
+    )
+
+    assert result == out_path
+    df = pd.read_parquet(out_path)
+    assert df["site_number"].tolist() == ["0080", "0001"]
+    assert df["qualifier"].tolist() == [None, "V"]
+
+
+def test_fetch_samples_for_parameter_widens_int_then_float_chunks(tmp_path, monkeypatch):
+    chunks = [
+        ("2020", pd.DataFrame({"site_number": ["0080", "0080"], "sample_measurement": [1, 2]})),
+        ("2021", pd.DataFrame({"site_number": ["0001"], "sample_measurement": [1.5]})),
+    ]
+    monkeypatch.setattr(measurements, "fetch_samples_by_state", lambda *a, **k: iter(chunks))
+    out_path = tmp_path / "88101.parquet"
+
+    measurements.fetch_samples_for_parameter(
+        "88101", "2020-01-01", "2021-12-31", "41", session=object(), output_path=out_path
+    )
+
+    assert pd.read_parquet(out_path)["sample_measurement"].tolist() == [1.0, 2.0, 1.5]
+
+
+def test_fetch_samples_for_parameter_leaves_no_file_when_a_chunk_fails(tmp_path, monkeypatch):
+    def failing_chunks(*args, **kwargs):
+        yield "2020", pd.DataFrame({"site_number": ["0080"], "sample_measurement": [1.5]})
+        raise RuntimeError("connection dropped")
+
+    monkeypatch.setattr(measurements, "fetch_samples_by_state", failing_chunks)
+    out_path = tmp_path / "88101.parquet"
+
+    with pytest.raises(RuntimeError):
+        measurements.fetch_samples_for_parameter(
+            "88101", "2020-01-01", "2021-12-31", "41", session=object(), output_path=out_path
+        )
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,44 @@
+"""Tests for the filesystem loaders."""
+
+from __future__ import annotations
+
+import json
+
+import pandas as pd
+
+from loaders.filesystem import AuditLogger, CsvAppender, append_csv
+
+
+def test_csv_appender_matches_append_csv(tmp_path):
+    frame = pd.DataFrame(
+        {
+            "site_number": ["0080", "0001"],
+            "sample_measurement": [1.25, None],
+            "qualifier": [None, "V, IT"],
+            "poc": [1, 2],
+        }
+    )
+    expected_path = tmp_path / "expected.csv"
+    actual_path = tmp_path / "actual.csv"
+
+    append_csv(frame, expected_path)
+    append_csv(frame, expected_path)
+    with CsvAppender() as appender:
+        appender.append(frame, actual_path)
+        appender.append(frame, actual_path)
+
+    assert actual_path.read_text(encoding="utf-8") == expected_path.read_text(
+        encoding="utf-8"
+    )
+
+
+def test_audit_logger_writes_all_records_as_jsonl(tmp_path):
+    path = tmp_path / "logs" / "audit.jsonl"
+    audit = AuditLogger(path)
+    audit.log({"parameter": "45201", "status": "ok"})
+    audit.flush()
+    audit.log({"parameter": "44201", "status": "failed"})
+    audit.flush()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["parameter"] for line in lines] == ["45201", "44201"]
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pandas as pd
+import pytest
 
 from aqs.transformers.monitors import transform_monitors
 
@@ -59,3 +62,48 @@ def test_transform_monitors_handles_empty_dataframe() -> None:
     empty_frame = pd.DataFrame()
     result = transform_monitors(empty_frame)
     assert result.empty
+
+
+def test_add_monitor_regions_assigns_region_or_unknown() -> None:
+    pytest.importorskip("geopandas")
+    from aqs.transformers.monitor_region import add_monitor_regions
+
+    monitors = pd.DataFrame(
+        {
+            "site_code": ["410510080", "060750010", "410000000"],
+            "latitude": [45.4966, 37.77, None],
+            "longitude": [-122.6027, -122.42, None],
+        }
+    )
+
+    result = add_monitor_regions(Path("."), monitors)
+
+    assert result["site_code"].tolist() == monitors["site_code"].tolist()
+    assert result["Region"].tolist() == ["Portland Metro", "Unknown", "Unknown"]
+
+
+def test_build_envista_metadata_expands_monitors_per_station() -> None:
+    from envista.extractors.monitors import build_envista_metadata
+
+    stations = pd.DataFrame(
+        {
+            "stationId": [1, 2, 3],
+            "shortName": ["SEL", "PCH", "EMPTY"],
+            "regions": [["NW", "Metro"], ["NW"], []],
+            "monitors": [
+                [{"channelId": 10, "name": "PM2.5"}, {"channelId": 11, "name": None}],
+                [{"channelId": 20}],
+                [],
+            ],
+        }
+    )
+
+    result = build_envista_metadata(stations)
+
+    assert result["station_id"].tolist() == [1, 1, 2]
+    assert result["site"].tolist() == ["sel", "sel", "pch"]
+    assert result["regions"].tolist() == ["NW, Metro", "NW, Metro", "NW"]
+    assert result["channel_id"].tolist() == [10, 11, 20]
+    # Defaults only fill keys the API omitted; explicit nulls are kept
+    assert result["monitor_name"].tolist() == ["PM2.5", None, "none"]
+    assert "monitors" not in result.columns
@@ -0,0 +1,127 @@
+"""Tests for the toxics TRV transformers.
+
+Frames are built and verified in memory so the suite never writes CSV output.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from aqs.transformers.trv_annual import transform_toxics_annual_trv
+from aqs.transformers.trv_sample import transform_toxics_trv
+
+DIM_POLLUTANT = Path(__file__).resolve().parents[1] / "ops" / "dimPollutant.csv"
+
+# Benzene (45201): MW 78.11, 6 carbon atoms, TRV cancer 0.13, noncancer 3, acute 29
+BENZENE_MW = 78.11000061
+
+
+def _build_sample_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "state_code": ["41", "41", None],
+            "county_code": ["51", "51", "5"],
+            "site_number": ["80", "80", "1"],
+            "parameter_code": [45201, 45201, 45201],
+            "poc": [1, 1, 2],
+            "parameter": ["Benzene", "Benzene", "Benzene"],
+            "date_local": ["2021-01-01", "2021-01-07", "2021-01-13"],
+            "sample_measurement": [1.0, 2.0, None],
+            "units_of_measure": [
+                "Parts per billion Carbon",
+                "Micrograms/cubic meter (25 C)",
+                "Parts per billion",
+            ],
+        }
+    )
+
+
+def _build_annual_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "state_code": ["41", "41"],
+            "county_code": ["51", "51"],
+            "site_number": ["80", "80"],
+            "parameter_code": ["45201", "45201"],
+            "year": [2021, 2021],
+            "units_of_measure": ["Parts per billion", "Nanograms/cubic meter (25 C)"],
+            "arithmetic_mean": [1.0, 260.0],
+            "first_max_value": [2.0, 580.0],
+            "second_max_value": [1.5, None],
+        }
+    )
+
+
+def test_transform_toxics_trv_outputs_expected_columns() -> None:
+    transformed = transform_toxics_trv(_build_sample_frame(), str(DIM_POLLUTANT))
+
+    for column in [
+        "site_code",
+        "sample_measurement_ug_m3",
+        "xtrv_cancer",
+        "xtrv_noncancer",
+        "xtrv_acute",
+        "method_code",
+    ]:
+        assert column in transformed.columns
+    assert len(transformed) == 3
+    assert transformed["site_code"].tolist() == ["410510080", "410510080", "410050001"]
+
+
+def test_transform_toxics_trv_converts_units() -> None:
+    transformed = transform_toxics_trv(_build_sample_frame(), str(DIM_POLLUTANT))
+
+    # ppbC -> ug/m3 divides by the carbon atom count
+    assert transformed.loc[0, "sample_measurement_ug_m3"] == pytest.approx(
+        BENZENE_MW / (6 * 24.45)
+    )
+    # Unknown unit aliases pass the value through unchanged
+    assert transformed.loc[1, "sample_measurement_ug_m3"] == pytest.approx(2.0)
+    assert pd.isna(transformed.loc[2, "sample_measurement_ug_m3"])
+    assert transformed.loc[0, "xtrv_cancer"] == pytest.approx(
+        BENZENE_MW / (6 * 24.45) / 0.13
+    )
+
+
+def test_transform_toxics_annual_trv_converts_and_computes_exceedances() -> None:
+    transformed = transform_toxics_annual_trv(_build_annual_frame(), str(DIM_POLLUTANT))
+
+    assert transformed["site_code"].tolist() == ["410510080", "410510080"]
+    assert transformed.loc[0, "arithmetic_mean_ug_m3"] == pytest.approx(
+        BENZENE_MW / 24.45
+    )
+    assert transformed.loc[1, "arithmetic_mean_ug_m3"] == pytest.approx(0.26)
+    assert transformed.loc[1, "first_max_value_ug_m3"] == pytest.approx(0.58)
+    assert pd.isna(transformed.loc[1, "second_max_value_ug_m3"])
+    assert transformed.loc[1, "xtrv_noncancer"] == pytest.approx(0.26 / 3)
+    assert transformed.loc[1, "xtrv_acute_first"] == pytest.approx(0.58 / 29)
+    # Columns absent from the input are still emitted in the output schema
+    assert transformed["tenth_percentile"].isna().all()
+
+
+def test_trv_transformers_leave_input_frames_unchanged() -> None:
+    sample = _build_sample_frame()
+    annual = _build_annual_frame()
+    sample_before, annual_before = sample.copy(), annual.copy()
+
+    transform_toxics_trv(sample, str(DIM_POLLUTANT))
+    transform_toxics_annual_trv(annual, str(DIM_POLLUTANT))
+
+    pd.testing.assert_frame_equal(sample, sample_before)
+    pd.testing.assert_frame_equal(annual, annual_before)
+
+
+def test_trv_transformers_handle_dim_pollutant_without_toxics(tmp_path) -> None:
+    dim = pd.read_csv(DIM_POLLUTANT, encoding="utf-8-sig")
+    no_toxics = tmp_path / "dimPollutant.csv"
+    dim[dim["group_store"] != "toxics"].to_csv(no_toxics, index=False)
+
+    sample = transform_toxics_trv(_build_sample_frame(), str(no_toxics))
+    annual = transform_toxics_annual_trv(_build_annual_frame(), str(no_toxics))
+
+    assert sample["trv_cancer"].isna().all()
+    assert sample["xtrv_acute"].isna().all()
+    assert annual["xtrv_cancer"].isna().all()